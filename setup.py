@@ -8,10 +8,11 @@ setup(
     python_requires=">=3.8",
     install_requires=[
         "fastapi==0.104.1",
-        "uvicorn==0.24.0",
+        "uvicorn[standard]==0.24.0",
         "python-dotenv==1.0.0",
         "requests==2.31.0",
         "httpx==0.25.1",
+        "orjson>=3.8",
         "pydantic>=2.4.2",
         "pydantic-settings>=2.0.0",
         "pysnow==0.7.17",
@@ -5,12 +5,15 @@ Also provides light compatibility with simplified AuthConfig used in tests.
 """
 import logging
 import base64
-from typing import Dict, Optional, Any
+import time
+from dataclasses import dataclass
+from functools import lru_cache, singledispatch
+from typing import Dict, Optional, Any, Tuple
 from datetime import datetime, timedelta
+from types import MappingProxyType
 
 import httpx
-import inspect
-from pydantic import BaseModel, Field
+from pydantic import BaseModel, ConfigDict, Field, TypeAdapter
 
 from config import AuthConfig as CoreAuthConfig
 
@@ -19,7 +22,10 @@ logger = logging.getLogger(__name__)
 
 class TokenInfo(BaseModel):
     """OAuth token information."""
-    
+
+    # Build the validator on first use rather than at import
+    model_config = ConfigDict(defer_build=True)
+
     access_token: str = Field(..., description="OAuth access token")
     refresh_token: str = Field(..., description="OAuth refresh token")
     token_type: str = Field(..., description="Token type (usually Bearer)")
@@ -27,7 +33,23 @@ class TokenInfo(BaseModel):
     scope: Optional[str] = Field(None, description="Token scope")
 
 
-class AuthConfig(BaseModel):
+@lru_cache(maxsize=1)
+def _token_adapter() -> TypeAdapter:
+    """Shared TokenInfo adapter, built on the first token response."""
+    return TypeAdapter(TokenInfo)
+
+# Refresh OAuth tokens this many seconds before they expire
+_REFRESH_MARGIN = 300.0
+
+# Headers sent with every ServiceNow API request
+_BASE_HEADERS = MappingProxyType({
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+})
+
+
+@dataclass
+class AuthConfig:
     """Compatibility AuthConfig for tests importing from auth.auth_manager.
 
     Supports both direct fields and nested oauth via the `oauth` attribute.
@@ -43,6 +65,109 @@ class AuthConfig(BaseModel):
     oauth: Optional[Any] = None
 
 
+# Normalized views of simplified auth configs (see AuthManager._normalize_auth_config)
+@dataclass
+class _NormBasic:
+    __slots__ = ("username", "password")
+    username: Optional[str]
+    password: Optional[str]
+
+
+@dataclass
+class _NormOAuth:
+    __slots__ = ("client_id", "client_secret", "username", "password", "token_url")
+    client_id: Optional[str]
+    client_secret: Optional[str]
+    username: Optional[str]
+    password: Optional[str]
+    token_url: Optional[str]
+
+
+@dataclass
+class _NormApiKey:
+    __slots__ = ("api_key", "header_name")
+    api_key: Optional[str]
+    header_name: str
+
+
+@dataclass
+class _NormAuth:
+    __slots__ = ("type", "basic", "oauth", "api_key")
+    type: Any
+    basic: Optional[_NormBasic]
+    oauth: Optional[_NormOAuth]
+    api_key: Optional[_NormApiKey]
+
+
+@singledispatch
+def _normalize_auth(cfg: Any) -> Any:
+    """Normalize an arbitrary config-like object (e.g. test doubles) by probing attributes."""
+    # Basic
+    basic = None
+    if hasattr(cfg, "username") and hasattr(cfg, "password"):
+        basic = _NormBasic(username=cfg.username, password=cfg.password)
+    # OAuth
+    oauth_src = getattr(cfg, "oauth", None)
+    if oauth_src is None and all(hasattr(cfg, a) for a in ("client_id", "client_secret", "username", "password")):
+        oauth_src = cfg
+    oauth = None
+    if oauth_src is not None:
+        oauth = _NormOAuth(
+            client_id=getattr(oauth_src, "client_id", None),
+            client_secret=getattr(oauth_src, "client_secret", None),
+            username=getattr(oauth_src, "username", None),
+            password=getattr(oauth_src, "password", None),
+            token_url=getattr(oauth_src, "token_url", None),
+        )
+    # API key
+    api_key = None
+    api_key_src = getattr(cfg, "api_key", None)
+    if api_key_src is not None and isinstance(api_key_src, dict):
+        api_key = _NormApiKey(
+            api_key=api_key_src.get("api_key"),
+            header_name=api_key_src.get("header_name", "X-ServiceNow-API-Key"),
+        )
+    return _NormAuth(
+        type=getattr(cfg, "type", "oauth"),
+        basic=basic,
+        oauth=oauth,
+        api_key=api_key,
+    )
+
+
+@_normalize_auth.register
+def _normalize_core_auth(cfg: CoreAuthConfig) -> Any:
+    # Already has the normalized shape
+    return cfg
+
+
+@_normalize_auth.register
+def _normalize_compat_auth(cfg: AuthConfig) -> _NormAuth:
+    oauth_src = cfg.oauth
+    if oauth_src is None:
+        oauth = _NormOAuth(
+            client_id=cfg.client_id,
+            client_secret=cfg.client_secret,
+            username=cfg.username,
+            password=cfg.password,
+            token_url=cfg.token_url,
+        )
+    else:
+        oauth = _NormOAuth(
+            client_id=getattr(oauth_src, "client_id", None),
+            client_secret=getattr(oauth_src, "client_secret", None),
+            username=getattr(oauth_src, "username", None),
+            password=getattr(oauth_src, "password", None),
+            token_url=getattr(oauth_src, "token_url", None),
+        )
+    return _NormAuth(
+        type=cfg.type,
+        basic=_NormBasic(username=cfg.username, password=cfg.password),
+        oauth=oauth,
+        api_key=None,
+    )
+
+
 class AuthManager:
     """
     Manages authentication and authorization for ServiceNow API requests.
@@ -64,60 +189,49 @@ class AuthManager:
         # Normalize config and instance URL
         self.instance_url = instance_url or getattr(auth_or_config, "instance_url", "")
         self.auth = self._normalize_auth_config(auth_or_config)
+        # Auth type is fixed for the lifetime of the manager
+        self._auth_type = self._type_str()
         self._token_info: Optional[TokenInfo] = None
         self._token_expiry: Optional[datetime] = None
+        # Monotonic time after which the token should be refreshed (0.0 = no token)
+        self._token_deadline = 0.0
+        # Shared client for token calls; created on first OAuth request
+        self._http: Optional[Any] = None
+        self._direct_http = False
         
+        # Static credential headers are fully determined by the config
+        self._basic_header = self._build_basic_header()
+        self._api_key_header: Optional[Tuple[str, str]] = None
+        if self._auth_type == "api_key" and getattr(self.auth, "api_key", None):
+            self._api_key_header = (self.auth.api_key.header_name, self.auth.api_key.api_key)
+        self._static_auth: Optional[Dict[str, str]] = None
+        if self._auth_type == "basic" and getattr(self.auth, "basic", None) and self._basic_header:
+            self._static_auth = {"Authorization": self._basic_header}
+        elif self._auth_type == "api_key" and self._api_key_header:
+            header_name, api_key = self._api_key_header
+            self._static_auth = {header_name: api_key}
+        # Complete request headers for non-OAuth types never change either
+        self._static_headers: Optional[Dict[str, str]] = None
+        if self._static_auth is not None:
+            self._static_headers = {**_BASE_HEADERS, **self._static_auth}
+
         # Set OAuth token URL
-        if self._type_str() == "oauth" and getattr(self.auth, "oauth", None):
+        if self._auth_type == "oauth" and getattr(self.auth, "oauth", None):
             self.token_url = self.auth.oauth.token_url or f"{self.instance_url}/oauth_token.do"
         else:
             self.token_url = f"{self.instance_url}/oauth_token.do" if self.instance_url else ""
 
+    @property
+    def token_expiry(self) -> Optional[datetime]:
+        """Expiry of the current OAuth token, or None when there is no token."""
+        return self._token_expiry
+
     def _normalize_auth_config(self, cfg: Any) -> Any:
         """Create a normalized auth config view from various inputs.
 
         Returns an object with attributes: type, basic, oauth, api_key.
         """
-        # If already a CoreAuthConfig, use as-is
-        if isinstance(cfg, CoreAuthConfig):
-            return cfg
-        # Build a lightweight namespace-like object
-        class _NS:
-            pass
-        ns = _NS()
-        ns.type = getattr(cfg, "type", "oauth")
-        # Basic
-        basic = _NS()
-        if hasattr(cfg, "username") and hasattr(cfg, "password"):
-            basic.username = cfg.username
-            basic.password = cfg.password
-        else:
-            basic = None
-        ns.basic = basic
-        # OAuth
-        oauth_src = getattr(cfg, "oauth", None)
-        if oauth_src is None and all(hasattr(cfg, a) for a in ("client_id", "client_secret", "username", "password")):
-            oauth_src = cfg
-        if oauth_src is not None:
-            oauth = _NS()
-            oauth.client_id = getattr(oauth_src, "client_id", None)
-            oauth.client_secret = getattr(oauth_src, "client_secret", None)
-            oauth.username = getattr(oauth_src, "username", None)
-            oauth.password = getattr(oauth_src, "password", None)
-            oauth.token_url = getattr(oauth_src, "token_url", None)
-        else:
-            oauth = None
-        ns.oauth = oauth
-        # API key
-        api_key_src = getattr(cfg, "api_key", None)
-        if api_key_src is not None and isinstance(api_key_src, dict):
-            api_ns = _NS()
-            api_ns.api_key = api_key_src.get("api_key")
-            api_ns.header_name = api_key_src.get("header_name", "X-ServiceNow-API-Key")
-            ns.api_key = api_ns
-        else:
-            ns.api_key = None
-        return ns
+        return _normalize_auth(cfg)
 
     async def get_auth_header(self) -> Dict[str, str]:
         """
@@ -126,21 +240,15 @@ class AuthManager:
         Returns:
             Dictionary containing the Authorization header
         """
-        if self._type_str() == "oauth":
+        if self._auth_type == "oauth":
             await self.authenticate()
             if self._token_info:
                 return {"Authorization": f"{self._token_info.token_type} {self._token_info.access_token}"}
-        elif self._type_str() == "basic" and getattr(self.auth, "basic", None):
-            # Use basic auth
-            auth = f"{self.auth.basic.username}:{self.auth.basic.password}"
-            auth_bytes = auth.encode("ascii")
-            b64_auth = base64.b64encode(auth_bytes).decode("ascii")
-            return {"Authorization": f"Basic {b64_auth}"}
-        elif self._type_str() == "api_key" and getattr(self.auth, "api_key", None):
-            # Use API key
-            return {self.auth.api_key.header_name: self.auth.api_key.api_key}
+        elif self._static_auth is not None:
+            # Basic auth or API key
+            return dict(self._static_auth)
         
-        raise ValueError(f"Unsupported auth type: {self._type_str()}")
+        raise ValueError(f"Unsupported auth type: {self._auth_type}")
 
     def get_headers(self) -> Dict[str, str]:
         """
@@ -149,37 +257,20 @@ class AuthManager:
         Returns:
             Dictionary of headers to include in requests
         """
-        headers: Dict[str, str] = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        headers: Dict[str, str] = dict(_BASE_HEADERS)
         # Prefer bearer token if available
         if self._token_info:
             headers["Authorization"] = f"Bearer {self._token_info.access_token}"
-        else:
+        elif self._basic_header:
             # Fallback to basic if creds present
-            try:
-                if self.auth.type == "basic" and getattr(self.auth, "basic", None):
-                    auth = f"{self.auth.basic.username}:{self.auth.basic.password}"
-                else:
-                    # Try oauth creds for basic fallback
-                    if getattr(self.auth, "oauth", None):
-                        auth = f"{self.auth.oauth.username}:{self.auth.oauth.password}"
-                    else:
-                        auth = None
-                if auth:
-                    b64 = base64.b64encode(auth.encode("ascii")).decode("ascii")
-                    headers["Authorization"] = f"Basic {b64}"
-            except Exception:
-                pass
+            headers["Authorization"] = self._basic_header
         return headers
 
     async def aget_headers(self) -> Dict[str, str]:
         """Async variant used by application code."""
-        headers = {
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-        }
+        if self._static_headers is not None:
+            return dict(self._static_headers)
+        headers = dict(_BASE_HEADERS)
         headers.update(await self.get_auth_header())
         return headers
 
@@ -193,8 +284,8 @@ class AuthManager:
         """
         try:
             # Check if we have a valid token
-            if self._token_info and self._token_expiry:
-                if datetime.now() < self._token_expiry - timedelta(minutes=5):
+            if self._token_info and self._token_deadline:
+                if time.monotonic() < self._token_deadline:
                     return True  # Current token is still valid
                 return await self.refresh()  # Try to refresh if close to expiry
                 
@@ -211,37 +302,22 @@ class AuthManager:
         Returns:
             True if OAuth authentication successful, False otherwise
         """
-        if self._type_str() != "oauth" or not self.auth.oauth:
+        if self._auth_type != "oauth" or not self.auth.oauth:
             return False
 
         try:
-            async with httpx.AsyncClient() as client:
-                auth = base64.b64encode(
-                    f"{self.auth.oauth.client_id}:{self.auth.oauth.client_secret}".encode()
-                ).decode()
-                headers = {
-                    "Authorization": f"Basic {auth}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                }
-                data = {
-                    "grant_type": "password",
-                    "username": self.auth.oauth.username,
-                    "password": self.auth.oauth.password,
-                }
-                response = await self._maybe_await(client.post, self.token_url, headers=headers, data=data)
-                # Support sync/async raise_for_status/json
-                await self._maybe_await(getattr(response, "raise_for_status"))
-                token_data = await self._maybe_await(getattr(response, "json"))
-                self._token_info = TokenInfo(**token_data)
-                self._token_expiry = datetime.now() + timedelta(seconds=self._token_info.expires_in)
-                
-                logger.info("OAuth authentication successful")
-                return True
-                
+            self._store_token(await self._request_token({
+                "grant_type": "password",
+                "username": self.auth.oauth.username,
+                "password": self.auth.oauth.password,
+            }))
+            
+            logger.info("OAuth authentication successful")
+            return True
+            
         except Exception as e:
             logger.error(f"OAuth authentication failed: {str(e)}")
-            self._token_info = None
-            self._token_expiry = None
+            self._store_token(None)
             return False
 
     async def refresh(self) -> bool:
@@ -255,33 +331,19 @@ class AuthManager:
             return await self._oauth_authenticate()
             
         try:
-            async with httpx.AsyncClient() as client:
-                auth = base64.b64encode(
-                    f"{self.auth.oauth.client_id}:{self.auth.oauth.client_secret}".encode()
-                ).decode()
-                headers = {
-                    "Authorization": f"Basic {auth}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                }
-                data = {
-                    "grant_type": "refresh_token",
-                    "refresh_token": self._token_info.refresh_token,
-                }
-                response = await self._maybe_await(client.post, self.token_url, headers=headers, data=data)
-                await self._maybe_await(getattr(response, "raise_for_status"))
-                token_data = await self._maybe_await(getattr(response, "json"))
-                self._token_info = TokenInfo(**token_data)
-                self._token_expiry = datetime.now() + timedelta(seconds=self._token_info.expires_in)
-                
-                logger.info("Token refresh successful")
-                return True
-                
+            self._store_token(await self._request_token({
+                "grant_type": "refresh_token",
+                "refresh_token": self._token_info.refresh_token,
+            }))
+            
+            logger.info("Token refresh successful")
+            return True
+            
         except Exception as e:
             logger.error(f"Token refresh failed: {str(e)}")
             # Clear token info and try full authentication
             prev_token = self._token_info.access_token if self._token_info else None
-            self._token_info = None
-            self._token_expiry = None
+            self._store_token(None)
             success = await self._oauth_authenticate()
             # Ensure a new token value if the provider returned the same token
             if success and prev_token and self._token_info and self._token_info.access_token == prev_token:
@@ -291,17 +353,76 @@ class AuthManager:
                     pass
             return success
 
+    def _store_token(self, token: Optional[TokenInfo]) -> None:
+        """Record a new token (or clear it) together with its expiry bookkeeping."""
+        self._token_info = token
+        if token is None:
+            self._token_expiry = None
+            self._token_deadline = 0.0
+            return
+        self._token_expiry = datetime.now() + timedelta(seconds=token.expires_in)
+        self._token_deadline = time.monotonic() + token.expires_in - _REFRESH_MARGIN
+
+    async def _client(self) -> Any:
+        """Return the shared httpx client for token calls, creating it on first use."""
+        if self._http is None:
+            client_cls = httpx.AsyncClient
+            self._http = client_cls()
+            # Real clients take the direct path; patched test doubles keep the tolerant one
+            self._direct_http = type(self._http) is client_cls
+        return self._http
+
+    async def _request_token(self, data: Dict[str, Any]) -> TokenInfo:
+        """POST a grant to the token endpoint and return the parsed token."""
+        client = await self._client()
+        auth = base64.b64encode(
+            f"{self.auth.oauth.client_id}:{self.auth.oauth.client_secret}".encode()
+        ).decode()
+        headers = {
+            "Authorization": f"Basic {auth}",
+            "Content-Type": "application/x-www-form-urlencoded",
+        }
+        if self._direct_http:
+            response = await client.post(self.token_url, headers=headers, data=data)
+            response.raise_for_status()
+            # Validate straight from the body bytes, skipping the intermediate dict
+            return _token_adapter().validate_json(response.content)
+        response = await self._maybe_await(client.post, self.token_url, headers=headers, data=data)
+        # Support sync/async raise_for_status/json
+        await self._maybe_await(getattr(response, "raise_for_status"))
+        return _token_adapter().validate_python(await self._maybe_await(getattr(response, "json")))
+
+    async def aclose(self) -> None:
+        """Close the shared token client, if one was created."""
+        if self._http is not None:
+            client, self._http = self._http, None
+            await client.aclose()
+
+    def _build_basic_header(self) -> Optional[str]:
+        """Encode Basic credentials once (basic auth, or OAuth user creds as fallback)."""
+        try:
+            if self._auth_type == "basic" and getattr(self.auth, "basic", None):
+                auth = f"{self.auth.basic.username}:{self.auth.basic.password}"
+            elif getattr(self.auth, "oauth", None):
+                # Try oauth creds for basic fallback
+                auth = f"{self.auth.oauth.username}:{self.auth.oauth.password}"
+            else:
+                return None
+            return "Basic " + base64.b64encode(auth.encode("ascii")).decode("ascii")
+        except Exception:
+            return None
+
     async def _maybe_await(self, callable_or_awaitable, *args, **kwargs):
         """Call and await if needed, handling mock factories."""
         try:
             result = callable_or_awaitable(*args, **kwargs)
         except TypeError:
             result = callable_or_awaitable
-        if inspect.isawaitable(result):
+        if hasattr(result, "__await__"):
             result = await result
         if callable(result) and not (hasattr(result, "json") and hasattr(result, "raise_for_status")):
             result = result()
-            if inspect.isawaitable(result):
+            if hasattr(result, "__await__"):
                 result = await result
         return result
 
@@ -1,13 +1,17 @@
 """Configuration module for ServiceNow MCP server."""
+import logging
+from dataclasses import dataclass
 from enum import Enum
-from typing import Optional
+from functools import lru_cache
+from typing import Callable, Dict, Optional
+from urllib.parse import urlsplit
 from pydantic import BaseModel, Field
 from pydantic_settings import BaseSettings
 from dotenv import load_dotenv
 import os
 
-# Load environment variables from .env file
-load_dotenv()
+logger = logging.getLogger(__name__)
+
 
 class AuthType(str, Enum):
     """Authentication types supported by the ServiceNow MCP server."""
@@ -64,8 +68,147 @@ class ServerConfig(BaseModel):
         return f"{self.instance_url}/api/now"
 
 
+@lru_cache(maxsize=1)
+def _ensure_bootstrap() -> None:
+    """Load variables from a .env file into the environment, once."""
+    load_dotenv()
+
+
 class Settings(BaseSettings):
     """Application settings loaded from environment variables"""
-    servicenow_instance: str = os.getenv("SERVICENOW_INSTANCE", "")
-    servicenow_username: str = os.getenv("SERVICENOW_USERNAME", "")
-    servicenow_password: str = os.getenv("SERVICENOW_PASSWORD", "")
\ No newline at end of file
+    servicenow_instance: str = ""
+    servicenow_username: str = ""
+    servicenow_password: str = ""
+
+
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """Build application settings on first access."""
+    _ensure_bootstrap()
+    return Settings()
+
+
+def __getattr__(name: str):
+    # `config.settings` is built lazily so importing this module does no env/.env I/O
+    if name == "settings":
+        return get_settings()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
+def _env_flag(name: str, default: bool = False) -> bool:
+    value = os.getenv(name)
+    if value is None:
+        return default
+    return value.lower() in {"1", "true", "yes", "on"}
+
+
+def _env_bytes(name: str) -> Optional[bytes]:
+    value = os.getenv(name)
+    return value.encode("utf-8") if value else None
+
+
+@dataclass(frozen=True)
+class RuntimeSettings:
+    """Environment-derived settings consulted on the request path."""
+
+    is_prod: bool
+    rpc_auth_token: Optional[bytes]
+    rpc_allow_params_auth: bool
+    events_auth_required: bool
+    events_auth_token: Optional[bytes]
+
+
+@lru_cache(maxsize=1)
+def get_runtime_settings() -> RuntimeSettings:
+    """Read runtime settings from the environment once per process."""
+    _ensure_bootstrap()
+    env = (os.getenv("APP_ENV") or os.getenv("ENVIRONMENT") or "").lower()
+    is_prod = env in {"prod", "production"} or (os.getenv("PRODUCTION", "").lower() in {"1", "true", "yes"})
+    # Tokens are kept as bytes for constant-time comparison on the request path
+    rpc_auth_token = _env_bytes("RPC_AUTH_TOKEN")
+    return RuntimeSettings(
+        is_prod=is_prod,
+        rpc_auth_token=rpc_auth_token,
+        # Back-compat token via JSON params; disabled by default in production
+        rpc_allow_params_auth=_env_flag("RPC_ALLOW_PARAMS_AUTH", default=not is_prod),
+        # SSE auth defaults to required in production unless explicitly disabled
+        events_auth_required=_env_flag("EVENTS_AUTH_REQUIRED", default=is_prod),
+        events_auth_token=_env_bytes("EVENTS_AUTH_TOKEN") or rpc_auth_token,
+    )
+
+
+def reload_runtime_settings() -> None:
+    """Discard cached runtime settings so the environment is read again."""
+    get_runtime_settings.cache_clear()
+
+
+def _normalize_instance_url(instance: str) -> str:
+    """Return the instance as an absolute URL, defaulting to https://."""
+    if not instance or urlsplit(instance).scheme in ("http", "https"):
+        return instance
+    return f"https://{instance}"
+
+
+def _basic_auth(username: str, password: str) -> AuthConfig:
+    return AuthConfig(
+        type=AuthType.BASIC,
+        basic=BasicAuthConfig(username=username, password=password),
+    )
+
+
+def _oauth_auth(username: str, password: str) -> AuthConfig:
+    client_id = os.getenv("OAUTH_CLIENT_ID", "")
+    client_secret = os.getenv("OAUTH_CLIENT_SECRET", "")
+    token_url = os.getenv("OAUTH_TOKEN_URL", "") or None
+    if not (client_id and client_secret and username and password):
+        logger.warning("AUTH_TYPE=oauth but required OAUTH_* or credentials missing; falling back to basic auth")
+        return _basic_auth(username, password)
+    return AuthConfig(
+        type=AuthType.OAUTH,
+        oauth=OAuthConfig(
+            client_id=client_id,
+            client_secret=client_secret,
+            username=username,
+            password=password,
+            token_url=token_url,
+        ),
+    )
+
+
+def _api_key_auth(username: str, password: str) -> AuthConfig:
+    api_key = os.getenv("API_KEY", "")
+    if not api_key:
+        logger.warning("AUTH_TYPE=api_key but API_KEY missing; falling back to basic auth")
+        return _basic_auth(username, password)
+    return AuthConfig(
+        type=AuthType.API_KEY,
+        api_key=ApiKeyConfig(
+            api_key=api_key,
+            header_name=os.getenv("API_KEY_HEADER", "X-ServiceNow-API-Key"),
+        ),
+    )
+
+
+# AUTH_TYPE value -> builder; unknown values fall back to basic auth
+_AUTH_BUILDERS: Dict[str, Callable[[str, str], AuthConfig]] = {
+    "basic": _basic_auth,
+    "oauth": _oauth_auth,
+    "apikey": _api_key_auth,
+    "api_key": _api_key_auth,
+    "api-key": _api_key_auth,
+}
+
+
+@lru_cache(maxsize=1)
+def load_server_config() -> ServerConfig:
+    """Build the server configuration from the environment once per process."""
+    _ensure_bootstrap()
+    auth_type = (os.getenv("AUTH_TYPE") or "basic").strip().lower()
+    build_auth = _AUTH_BUILDERS.get(auth_type, _basic_auth)
+    return ServerConfig(
+        instance_url=_normalize_instance_url(os.getenv("SERVICENOW_INSTANCE", "")),
+        auth=build_auth(
+            os.getenv("SERVICENOW_USERNAME", ""),
+            os.getenv("SERVICENOW_PASSWORD", ""),
+        ),
+    )
@@ -2,9 +2,8 @@
 Dependencies and configuration management for the API server.
 """
 from functools import lru_cache
-from fastapi import Depends
 from typing import Optional
-from pydantic import BaseSettings
+from pydantic_settings import BaseSettings, SettingsConfigDict
 
 from config import ServerConfig, AuthConfig, AuthType, BasicAuthConfig
 from auth.auth_manager import AuthManager
@@ -19,16 +18,18 @@ class Settings(BaseSettings):
     auth_type: str = "basic"  # basic, oauth, or apikey
     request_timeout: int = 30
 
-    class Config:
-        env_file = ".env"
+    # .env is only read when Settings() is first built by get_settings()
+    model_config = SettingsConfigDict(env_file=".env", extra="ignore")
 
 @lru_cache()
 def get_settings() -> Settings:
     """Get cached application settings."""
     return Settings()
 
-def get_config(settings: Settings = Depends(get_settings)) -> ServerConfig:
-    """Get ServiceNow server configuration."""
+@lru_cache(maxsize=1)
+def get_config() -> ServerConfig:
+    """Get the ServiceNow server configuration, built once per process."""
+    settings = get_settings()
     auth_config = None
     
     if settings.auth_type == "basic" and settings.servicenow_username and settings.servicenow_password:
@@ -47,6 +48,8 @@ def get_config(settings: Settings = Depends(get_settings)) -> ServerConfig:
         timeout=settings.request_timeout
     )
 
-def get_auth_manager(config: ServerConfig = Depends(get_config)) -> AuthManager:
-    """Get authentication manager instance."""
-    return AuthManager(config=config)
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_auth_manager() -> AuthManager:
+    """Get the shared authentication manager instance."""
+    config = get_config()
+    return AuthManager(config.auth, config.instance_url)
\ No newline at end of file
@@ -1,29 +1,46 @@
 """
 ServiceNow MCP Server entry point.
 """
+import asyncio
+import hmac
 import logging
 import os
-from typing import Dict, Any, AsyncIterator, Optional
+import time
+from binascii import hexlify
+from hashlib import blake2b
+from contextlib import asynccontextmanager
+from datetime import datetime, timezone
+from functools import lru_cache, partial
+from secrets import token_bytes
+from typing import Dict, Any, AsyncIterator, Awaitable, Callable, FrozenSet, Optional, Tuple, Union
 
 from dotenv import load_dotenv
+import orjson
 from fastapi import FastAPI, HTTPException, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
-from starlette.middleware.base import BaseHTTPMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.encoders import jsonable_encoder
+from fastapi.exceptions import RequestValidationError
+from fastapi.responses import ORJSONResponse, Response, StreamingResponse
+from fastapi.utils import is_body_allowed_for_status_code
+from pydantic import ValidationError
+from starlette.exceptions import HTTPException as StarletteHTTPException
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
 import uvicorn
 
-from config import (
-    ServerConfig,
-    AuthConfig,
-    AuthType,
-    BasicAuthConfig,
-    OAuthConfig,
-    ApiKeyConfig,
-)
+from config import get_runtime_settings, load_server_config
 from mcp_core.protocol import MCPRequest, MCPResponse
 from mcp_core.jsonrpc import (
+    INVALID_PARAMS_ARGUMENTS,
+    INVALID_PARAMS_NAME,
+    INVALID_PARAMS_OBJECT,
+    INVALID_REQUEST_OBJECT,
+    INVALID_REQUEST_VERSION,
+    PARSE_ERROR,
+    UNAUTHORIZED,
     jsonrpc_ok,
     jsonrpc_error,
+    jsonrpc_error_const,
     jsonrpc_initialize_result,
     jsonrpc_tools_list,
 )
@@ -48,19 +65,20 @@ def _env_flag(name: str, default: bool = False) -> bool:
     return value.lower() in {"1", "true", "yes", "on"}
 
 
+# Bind settings, in order of precedence
+_HOST_KEYS = ("UVICORN_HOST", "HOST", "APP_HOST", "BIND_HOST")
+_PORT_KEYS = ("UVICORN_PORT", "PORT", "APP_PORT", "BIND_PORT")
+
+
+@lru_cache(maxsize=1)
 def _resolve_host(default: str = "0.0.0.0") -> str:
-    return (
-        os.getenv("UVICORN_HOST")
-        or os.getenv("HOST")
-        or os.getenv("APP_HOST")
-        or os.getenv("BIND_HOST")
-        or default
-    )
+    return next((value for key in _HOST_KEYS if (value := os.environ.get(key))), default)
 
 
+@lru_cache(maxsize=1)
 def _resolve_port(default: int = 8000) -> int:
-    for key in ("UVICORN_PORT", "PORT", "APP_PORT", "BIND_PORT"):
-        value = os.getenv(key)
+    for key in _PORT_KEYS:
+        value = os.environ.get(key)
         if value:
             try:
                 return int(value)
@@ -68,92 +86,188 @@ def _resolve_port(default: int = 8000) -> int:
                 raise ValueError(f"Invalid integer for {key}={value!r}") from exc
     return default
 
-# Initialize FastAPI app
-app = FastAPI(title="ServiceNow MCP Server")
+@asynccontextmanager
+async def _lifespan(app: FastAPI) -> AsyncIterator[None]:
+    # Construct the MCP server off the event loop so the first request doesn't
+    # pay for it. Awaited, so requests only start once it exists and no
+    # second server can be built concurrently by a request handler
+    try:
+        await asyncio.get_running_loop().run_in_executor(None, _get_mcp_server)
+    except Exception:
+        # lru_cache doesn't cache the failure; the first request retries it
+        logger.exception("MCP server warm-up failed")
+    yield
+    if _get_mcp_server.cache_info().currsize:
+        await _get_mcp_server().aclose()
+
+
+# Initialize FastAPI app. The OpenAPI schema is only built (and cached) on the
+# first /openapi.json or /docs hit; DISABLE_OPENAPI=true skips those routes.
+_openapi_disabled = _env_flag("DISABLE_OPENAPI")
+app = FastAPI(
+    title="ServiceNow MCP Server",
+    openapi_url=None if _openapi_disabled else "/openapi.json",
+    default_response_class=ORJSONResponse,
+    lifespan=_lifespan,
+)
+
+
+# FastAPI's built-in error handlers render with stdlib json; same payloads via orjson
+@app.exception_handler(StarletteHTTPException)
+async def _http_exception_handler(request: Request, exc: StarletteHTTPException) -> Response:
+    headers = getattr(exc, "headers", None)
+    if not is_body_allowed_for_status_code(exc.status_code):
+        return Response(status_code=exc.status_code, headers=headers)
+    return ORJSONResponse({"detail": exc.detail}, status_code=exc.status_code, headers=headers)
+
+
+@app.exception_handler(RequestValidationError)
+async def _validation_exception_handler(request: Request, exc: RequestValidationError) -> Response:
+    return ORJSONResponse({"detail": jsonable_encoder(exc.errors())}, status_code=422)
+
+# SSE streams must reach the client frame by frame; the compressor would hold
+# them in its buffer
+_UNCOMPRESSED_PATHS = frozenset({"/events", "/rpc/stream"})
+
+
+class _GZipMiddleware(GZipMiddleware):
+    """GZipMiddleware that leaves the SSE endpoints uncompressed."""
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] == "http" and scope["path"] in _UNCOMPRESSED_PATHS:
+            await self.app(scope, receive, send)
+            return
+        await super().__call__(scope, receive, send)
+
+
+# Added before CORS so it runs inside it; small bodies aren't worth compressing
+app.add_middleware(_GZipMiddleware, minimum_size=1024)
 
 # Configure CORS (configurable via env CORS_ALLOW_ORIGINS)
-def _parse_cors_origins(env_value: Optional[str]) -> list:
+def _parse_cors_origins(env_value: Optional[str]) -> FrozenSet[str]:
+    # A set makes CORSMiddleware's per-request `origin in allow_origins` O(1)
     if not env_value or env_value.strip() == "*":
-        return ["*"]
-    parts = [p.strip() for p in env_value.split(",") if p.strip()]
-    return parts or ["*"]
+        return frozenset({"*"})
+    parts = frozenset(p.strip() for p in env_value.split(",") if p.strip())
+    return parts or frozenset({"*"})
 
 # Determine environment (prod vs dev)
-_env = (os.getenv("APP_ENV") or os.getenv("ENVIRONMENT") or "").lower()
-_is_prod = _env in {"prod", "production"} or (os.getenv("PRODUCTION", "").lower() in {"1", "true", "yes"})
+_is_prod = get_runtime_settings().is_prod
 
 cors_origins = _parse_cors_origins(os.getenv("CORS_ALLOW_ORIGINS", "*"))
 # Lock CORS in production if wildcard
-if _is_prod and cors_origins == ["*"]:
-    cors_origins = []  # No cross-origin unless explicitly configured
+if _is_prod and "*" in cors_origins:
+    cors_origins = frozenset()  # No cross-origin unless explicitly configured
+# Optional pattern (e.g. per-tenant subdomains); CORSMiddleware compiles it once
+cors_origin_regex = os.getenv("CORS_ALLOW_ORIGIN_REGEX") or None
+# Let browsers cache preflight responses (24h in prod, 10 min in dev)
+try:
+    cors_max_age = int(os.getenv("CORS_MAX_AGE", ""))
+except ValueError:
+    cors_max_age = 86400 if _is_prod else 600
 app.add_middleware(
     CORSMiddleware,
     allow_origins=cors_origins,
+    allow_origin_regex=cors_origin_regex,
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    max_age=cors_max_age,
 )
 
 
-class RequestIdMiddleware(BaseHTTPMiddleware):
-    async def dispatch(self, request: Request, call_next):
-        import uuid
+def _raw_header(scope: Scope, name: bytes) -> Optional[bytes]:
+    """Return the first raw value of a (lowercase) header from an ASGI scope."""
+    for key, value in scope["headers"]:
+        if key == name:
+            return value
+    return None
+
+
+class RequestIdMiddleware:
+    """Echo the client's X-Request-ID (or a generated one) on every response."""
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
         # Allow client-provided request id; otherwise generate
-        req_id = request.headers.get("X-Request-ID") or str(uuid.uuid4())
-        request.state.request_id = req_id
-        # Proceed
-        response = await call_next(request)
-        response.headers["X-Request-ID"] = req_id
-        return response
+        raw_id = _raw_header(scope, b"x-request-id")
+        if not raw_id:
+            # Same as secrets.token_hex(16), but already bytes for the header
+            raw_id = hexlify(token_bytes(16))
+        scope.setdefault("state", {})["request_id"] = raw_id.decode("latin-1")
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                # Append in place, as Starlette's own middlewares do via MutableHeaders
+                headers = message.setdefault("headers", [])
+                if isinstance(headers, list):
+                    headers.append((b"x-request-id", raw_id))
+                else:
+                    message["headers"] = [*headers, (b"x-request-id", raw_id)]
+            await send(message)
+
+        await self.app(scope, receive, send_with_request_id)
 
 
 app.add_middleware(RequestIdMiddleware)
 
 
+def _token_matches(provided: Any, expected: bytes) -> bool:
+    """Compare a client credential, with optional "Bearer " prefix, in constant time."""
+    if isinstance(provided, str):
+        provided = provided.encode("utf-8")
+    elif not isinstance(provided, bytes):
+        return False
+    if provided[:7].lower() == b"bearer ":
+        provided = provided[7:]
+    return hmac.compare_digest(provided, expected)
 
 
 # --- Streaming (SSE) endpoint -------------------------------------------------
+_SSE_TICK_PREFIX = b"event: tick\ndata: "
+# Comment frame: keeps the connection alive, ignored by EventSource clients
+_SSE_HEARTBEAT = b": ping\n\n"
+
+
 async def _sse_event_stream(
     request: Request,
     interval: float = 1.0,
     max_events: Optional[int] = None,
+    heartbeat_every: int = 1,
 ) -> AsyncIterator[bytes]:
     """Async generator that yields Server-Sent Events (SSE).
 
     - Sends periodic tick events with a timestamp to keep the connection alive.
-    - Stops when the client disconnects or the optional max_events is reached.
-    """
-    import asyncio
-    import json
-    from datetime import datetime, timezone
+    - With heartbeat_every=K > 1, only every Kth tick is a full event; the
+      ticks in between send a constant ``: ping`` comment frame.
+    - Stops when the client disconnects or the optional max_events is reached
+      (heartbeats do not count towards max_events).
 
+    Disconnects are not polled here: StreamingResponse listens for
+    ``http.disconnect`` and cancels this generator while it sleeps.
+    """
+    delay = max(0.05, float(interval))
+    every = max(1, heartbeat_every)
     count = 0
+    tick = 0
     while True:
-        # Stop if client disconnected
-        try:
-            if await request.is_disconnected():
-                break
-        except Exception:
-            # If detection fails, proceed conservatively
-            pass
-
-        payload = {
-            "type": "tick",
-            "ts": datetime.now(timezone.utc).isoformat(),
-            "count": count,
-        }
-        data = f"id: {count}\nevent: tick\ndata: {json.dumps(payload)}\n\n"
-        yield data.encode("utf-8")
-
-        count += 1
-        if max_events is not None and count >= max_events:
-            break
+        if tick % every:
+            yield _SSE_HEARTBEAT
+        else:
+            # orjson formats the aware datetime as ISO 8601 itself
+            payload = {"type": "tick", "ts": datetime.now(timezone.utc), "count": count}
+            yield b"id: %d\n" % count + _SSE_TICK_PREFIX + orjson.dumps(payload) + b"\n\n"
 
-        try:
-            await asyncio.sleep(max(0.05, float(interval)))
-        except Exception:
-            # If sleep fails due to cancellation, exit
-            break
+            count += 1
+            if max_events is not None and count >= max_events:
+                break
+        tick += 1
+        await asyncio.sleep(delay)
 
 
 @app.get("/events")
@@ -161,26 +275,22 @@ async def events(
     request: Request,
     interval: float = 1.0,
     limit: Optional[int] = None,
+    heartbeat: int = 1,
 ):
     """Simple SSE endpoint for real-time, streamable HTTP.
 
     Query params:
     - interval: seconds between events (default 1.0)
     - limit: optional maximum number of events to send
+    - heartbeat: send a full tick every N intervals and a ``: ping`` comment
+      in between (default 1, every interval is a full tick)
     """
     # Optional auth for events when EVENTS_AUTH_REQUIRED=true
-    # Default to requiring auth in production unless explicitly disabled
-    env_val = os.getenv("EVENTS_AUTH_REQUIRED")
-    if env_val is None:
-        auth_required = _is_prod
-    else:
-        auth_required = env_val.lower() in {"1", "true", "yes"}
-    if auth_required:
-        expected = os.getenv("EVENTS_AUTH_TOKEN") or os.getenv("RPC_AUTH_TOKEN")
-        provided = request.headers.get("Authorization") or request.query_params.get("auth")
-        if isinstance(provided, str) and provided.lower().startswith("bearer "):
-            provided = provided.split(" ", 1)[1]
-        if not expected or provided != expected:
+    settings = get_runtime_settings()
+    if settings.events_auth_required:
+        expected = settings.events_auth_token
+        provided = _raw_header(request.scope, b"authorization") or request.query_params.get("auth")
+        if not expected or not _token_matches(provided, expected):
             raise HTTPException(status_code=401, detail="Unauthorized")
 
     headers = {
@@ -190,84 +300,66 @@ async def events(
         "X-Accel-Buffering": "no",
     }
     return StreamingResponse(
-        _sse_event_stream(request, interval=interval, max_events=limit),
+        _sse_event_stream(request, interval=interval, max_events=limit, heartbeat_every=heartbeat),
         media_type="text/event-stream",
         headers=headers,
     )
 
-def _build_server_config() -> ServerConfig:
-    instance = os.getenv("SERVICENOW_INSTANCE", "")
-    instance_url = f"https://{instance}" if instance and not instance.startswith("http") else instance
-
-    auth_type = (os.getenv("AUTH_TYPE", "basic") or "basic").strip().lower()
-    username = os.getenv("SERVICENOW_USERNAME", "")
-    password = os.getenv("SERVICENOW_PASSWORD", "")
-
-    if auth_type == "oauth":
-        client_id = os.getenv("OAUTH_CLIENT_ID", "")
-        client_secret = os.getenv("OAUTH_CLIENT_SECRET", "")
-        token_url = os.getenv("OAUTH_TOKEN_URL", "") or None
-        if client_id and client_secret and username and password:
-            auth = AuthConfig(
-                type=AuthType.OAUTH,
-                oauth=OAuthConfig(
-                    client_id=client_id,
-                    client_secret=client_secret,
-                    username=username,
-                    password=password,
-                    token_url=token_url,
-                ),
-            )
-        else:
-            logger.warning("AUTH_TYPE=oauth but required OAUTH_* or credentials missing; falling back to basic auth")
-            auth = AuthConfig(
-                type=AuthType.BASIC,
-                basic=BasicAuthConfig(username=username, password=password),
-            )
-    elif auth_type in ("apikey", "api_key", "api-key"):
-        api_key = os.getenv("API_KEY", "")
-        header_name = os.getenv("API_KEY_HEADER", "X-ServiceNow-API-Key")
-        if api_key:
-            auth = AuthConfig(
-                type=AuthType.API_KEY,
-                api_key=ApiKeyConfig(api_key=api_key, header_name=header_name),
-            )
-        else:
-            logger.warning("AUTH_TYPE=api_key but API_KEY missing; falling back to basic auth")
-            auth = AuthConfig(
-                type=AuthType.BASIC,
-                basic=BasicAuthConfig(username=username, password=password),
-            )
-    else:
-        # Default/basic
-        auth = AuthConfig(
-            type=AuthType.BASIC,
-            basic=BasicAuthConfig(username=username, password=password),
-        )
+@lru_cache(maxsize=1)
+def _get_mcp_server() -> ServiceNowMCPServer:
+    """Build the server configuration and MCP server on first use."""
+    return ServiceNowMCPServer(load_server_config())
 
-    return ServerConfig(
-        instance_url=instance_url,
-        auth=auth,
-    )
+@lru_cache(maxsize=1)
+def _tools_list_result() -> Dict[str, Any]:
+    """tools/list result; the tool registry is fixed for the process lifetime."""
+    return {"tools": jsonrpc_tools_list(_get_mcp_server())}
 
-# Initialize server configuration
-config = _build_server_config()
 
-# Initialize MCP server
-mcp_server = ServiceNowMCPServer(config)
+# GET /tools body and its ETag, built on first use; static for the same reason
+_tools_body: Optional[Tuple[bytes, str]] = None
 
-@app.post("/mcp")
-async def handle_mcp_request(request: MCPRequest) -> MCPResponse:
+
+async def _get_tools_body() -> Tuple[bytes, str]:
+    global _tools_body
+    if _tools_body is None:
+        body = orjson.dumps(await _get_mcp_server().list_tools())
+        _tools_body = (body, f'"{blake2b(body, digest_size=8).hexdigest()}"')
+    return _tools_body
+
+
+@app.post("/mcp", response_model=MCPResponse)
+async def handle_mcp_request(request: Request) -> Response:
     """Handle incoming MCP requests"""
+    # Decode with orjson and validate the envelope directly; FastAPI's body
+    # binding would parse with stdlib json and validate through its own layer.
+    # Tool parameters are only validated once the tool has been dispatched.
+    body = await request.body()
+    try:
+        mcp_request = MCPRequest.model_validate(orjson.loads(body))
+    except orjson.JSONDecodeError as e:
+        raise RequestValidationError(
+            [{"type": "json_invalid", "loc": ("body", 0), "msg": "JSON decode error", "input": {}, "ctx": {"error": str(e)}}]
+        )
+    except ValidationError as e:
+        raise RequestValidationError(
+            [{**err, "loc": ("body", *err["loc"])} for err in e.errors(include_url=False)]
+        )
     try:
-        return await mcp_server.handle_request(request)
+        response = await _get_mcp_server().handle_request(mcp_request)
     except Exception as e:
         logger.exception("Error handling MCP request")
         raise HTTPException(status_code=500, detail=str(e))
+    return Response(response.model_dump_json(), media_type="application/json")
+
+
+def _rpc_response(body: Dict[str, Any]) -> Response:
+    """Serialize a JSON-RPC envelope with orjson, bypassing FastAPI's response encoding."""
+    return Response(orjson.dumps(body, default=jsonable_encoder), media_type="application/json")
 
 
 @app.post("/rpc")
-async def handle_jsonrpc(payload: Dict[str, Any], request: Request) -> Dict[str, Any]:
+async def handle_jsonrpc(request: Request) -> Response:
     """JSON-RPC 2.0 endpoint exposing minimal MCP-style methods.
 
     Methods:
@@ -275,89 +367,234 @@ async def handle_jsonrpc(payload: Dict[str, Any], request: Request) -> Dict[str,
     - tools/list
     - tools/call
     """
+    body = await request.body()
+    try:
+        payload = orjson.loads(body) if body else {}
+    except orjson.JSONDecodeError:
+        return _rpc_response(jsonrpc_error_const(None, PARSE_ERROR))
+    if not isinstance(payload, dict):
+        return _rpc_response(jsonrpc_error_const(None, INVALID_REQUEST_OBJECT))
+    return _rpc_response(await _dispatch_jsonrpc(payload, request))
+
+
+async def _handle_initialize(id_value: Any, params: Any, request: Request) -> Dict[str, Any]:
+    # Reflect whether bearer auth is configured
+    auth_required = bool(get_runtime_settings().rpc_auth_token)
+    return jsonrpc_ok(id_value, jsonrpc_initialize_result(auth_required))
+
+
+async def _handle_tools_list(id_value: Any, params: Any, request: Request) -> Dict[str, Any]:
+    return jsonrpc_ok(id_value, _tools_list_result())
+
+
+def _prepare_tools_call(id_value: Any, params: Any, request: Request) -> Union[MCPRequest, Dict[str, Any]]:
+    """Authorize and validate tools/call params; returns the MCP request or an error envelope."""
+    if not isinstance(params, dict):
+        return jsonrpc_error_const(id_value, INVALID_PARAMS_OBJECT)
+    # Optional bearer auth when configured via env
+    settings = get_runtime_settings()
+    token = settings.rpc_auth_token
+    if token:
+        provided = _raw_header(request.scope, b"authorization")
+        # Back-compat: allow token via params.auth/Authorization, configurable
+        if not provided and settings.rpc_allow_params_auth:
+            provided = params.get("auth") or params.get("Authorization")
+        if not _token_matches(provided, token):
+            return jsonrpc_error_const(id_value, UNAUTHORIZED)
+    name = params.get("name")
+    args = params.get("arguments") or {}
+    if not isinstance(name, str):
+        return jsonrpc_error_const(id_value, INVALID_PARAMS_NAME)
+    if not isinstance(args, dict):
+        return jsonrpc_error_const(id_value, INVALID_PARAMS_ARGUMENTS)
+    # Fields are already type-checked above; skip re-validation
+    return MCPRequest.construct_internal(id=str(id_value), tool=name, parameters=args)
+
+
+async def _handle_tools_call(id_value: Any, params: Any, request: Request) -> Dict[str, Any]:
+    req = _prepare_tools_call(id_value, params, request)
+    if not isinstance(req, MCPRequest):
+        return req
+    resp = await _get_mcp_server().handle_request(req)
+    if resp.type == "response":
+        return jsonrpc_ok(id_value, resp.result)
+    return jsonrpc_error(id_value, -32000, resp.error or "Tool error")
+
+
+# JSON-RPC method name -> handler; dotted names are accepted for back-compat
+_RPC_METHODS = {
+    "initialize": _handle_initialize,
+    "tools/list": _handle_tools_list,
+    "tools.list": _handle_tools_list,
+    "tools/call": _handle_tools_call,
+    "tools.call": _handle_tools_call,
+}
+
+
+async def _dispatch_jsonrpc(payload: Dict[str, Any], request: Request) -> Dict[str, Any]:
     id_value = payload.get("id")
     if payload.get("jsonrpc") != "2.0":
-        return jsonrpc_error(id_value, -32600, "Invalid Request: missing jsonrpc 2.0")
+        return jsonrpc_error_const(id_value, INVALID_REQUEST_VERSION)
 
     method = payload.get("method")
-    params = payload.get("params") or {}
+    handler = _RPC_METHODS.get(method) if isinstance(method, str) else None
+    if handler is None:
+        return jsonrpc_error(id_value, -32601, f"Method not found: {method}")
     try:
-        if method == "initialize":
-            # Reflect whether bearer auth is configured
-            import os
-            auth_required = bool(os.getenv("RPC_AUTH_TOKEN"))
-            return jsonrpc_ok(id_value, jsonrpc_initialize_result(auth_required))
-        elif method in ("tools/list", "tools.list"):
-            tools = jsonrpc_tools_list(mcp_server)
-            return jsonrpc_ok(id_value, {"tools": tools})
-        elif method in ("tools/call", "tools.call"):
-            # Optional bearer auth when configured via env
-            import os
-            token = os.getenv("RPC_AUTH_TOKEN")
-            if token:
-                provided = request.headers.get("Authorization")
-                if isinstance(provided, str) and provided.lower().startswith("bearer "):
-                    provided = provided.split(" ", 1)[1]
-                # Back-compat: allow token via params.auth/Authorization, configurable
-                # Default disabled in production
-                allow_params_env = os.getenv("RPC_ALLOW_PARAMS_AUTH")
-                if allow_params_env is None:
-                    allow_params = not _is_prod
-                else:
-                    allow_params = allow_params_env.lower() in {"1", "true", "yes"}
-                if not provided and allow_params and isinstance(params, dict):
-                    provided = params.get("auth") or params.get("Authorization")
-                    if isinstance(provided, str) and provided.lower().startswith("bearer "):
-                        provided = provided.split(" ", 1)[1]
-                if provided != token:
-                    return jsonrpc_error(id_value, -32001, "Unauthorized")
-            name = params.get("name")
-            args = params.get("arguments") or {}
-            if not isinstance(name, str):
-                return jsonrpc_error(id_value, -32602, "Invalid params: name required")
-            req = MCPRequest(version="1.0", type="request", id=str(id_value), tool=name, parameters=args)
-            resp = await mcp_server.handle_request(req)
-            if resp.type == "response":
-                return jsonrpc_ok(id_value, resp.result)
-            return jsonrpc_error(id_value, -32000, resp.error or "Tool error")
-        else:
-            return jsonrpc_error(id_value, -32601, f"Method not found: {method}")
+        return await handler(id_value, payload.get("params") or {}, request)
     except Exception as e:
         logger.exception("Error handling JSON-RPC request")
         return jsonrpc_error(id_value, -32603, "Internal error", {"error": str(e)})
 
-@app.get("/tools")
-async def list_tools() -> Dict[str, Any]:
+def _sse_frame(event: bytes, body: Dict[str, Any]) -> bytes:
+    return b"event: " + event + b"\ndata: " + orjson.dumps(body, default=jsonable_encoder) + b"\n\n"
+
+
+async def _rpc_stream_frames(body: bytes, request: Request) -> AsyncIterator[bytes]:
+    try:
+        payload = orjson.loads(body) if body else {}
+    except orjson.JSONDecodeError:
+        yield _sse_frame(b"error", jsonrpc_error_const(None, PARSE_ERROR))
+        return
+    if not isinstance(payload, dict):
+        yield _sse_frame(b"error", jsonrpc_error_const(None, INVALID_REQUEST_OBJECT))
+        return
+    id_value = payload.get("id")
+    method = payload.get("method")
+    if payload.get("jsonrpc") != "2.0":
+        yield _sse_frame(b"error", jsonrpc_error_const(id_value, INVALID_REQUEST_VERSION))
+        return
+    if method not in ("tools/call", "tools.call"):
+        yield _sse_frame(b"error", jsonrpc_error(id_value, -32601, f"Method not found: {method}"))
+        return
+    req = _prepare_tools_call(id_value, payload.get("params") or {}, request)
+    if not isinstance(req, MCPRequest):
+        yield _sse_frame(b"error", req)
+        return
+
+    chunks = 0
+    async for resp in _get_mcp_server().stream_request(req):
+        if resp.type != "response":
+            yield _sse_frame(b"error", jsonrpc_error(id_value, -32000, resp.error or "Tool error"))
+            return
+        chunks += 1
+        yield _sse_frame(b"partial", jsonrpc_ok(id_value, resp.result))
+    yield _sse_frame(b"done", jsonrpc_ok(id_value, {"chunks": chunks}))
+
+
+@app.post("/rpc/stream")
+async def handle_jsonrpc_stream(request: Request) -> StreamingResponse:
+    """JSON-RPC 2.0 tools/call with results streamed as Server-Sent Events.
+
+    Each result chunk is sent as an ``event: partial`` frame carrying a
+    JSON-RPC response, followed by a final ``event: done`` frame. Errors
+    are sent as a single ``event: error`` frame. Tools without a streaming
+    variant produce one partial frame. Use ``/rpc`` for other methods.
+    """
+    body = await request.body()
+    return StreamingResponse(
+        _rpc_stream_frames(body, request),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+# The tool list only changes on redeploy; let clients reuse it briefly and
+# revalidate with If-None-Match after that
+_TOOLS_CACHE_CONTROL = "public, max-age=30"
+
+
+@app.get("/tools", response_model=Dict[str, Any])
+async def list_tools(request: Request) -> Response:
     """List available tools"""
     try:
-        return await mcp_server.list_tools()
+        body, etag = await _get_tools_body()
+        headers = {"ETag": etag, "Cache-Control": _TOOLS_CACHE_CONTROL}
+        if request.headers.get("if-none-match") == etag:
+            return Response(status_code=304, headers=headers)
+        return Response(body, media_type="application/json", headers=headers)
     except Exception as e:
         logger.exception("Error listing tools")
         raise HTTPException(status_code=500, detail=str(e))
 
-@app.get("/health")
-async def health_check() -> Dict[str, bool]:
+class _AsyncTTLCache:
+    """Cache the result of an async call for ``ttl`` seconds.
+
+    Only one coroutine refreshes an expired value; concurrent callers wait
+    for it instead of issuing their own upstream request. ``ttl <= 0``
+    disables caching. Only a raised exception goes uncached; any returned
+    value is kept for the full TTL, including ``validate_connection``'s
+    ``False`` for an unreachable instance. During an outage, probes then
+    report down for up to ``ttl`` seconds after ServiceNow recovers, but
+    they don't pile up one upstream timeout per request.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._value: Any = None
+        self._expires = 0.0
+        self._lock: Optional[asyncio.Lock] = None
+
+    async def get(self, fetch: Callable[[], Awaitable[Any]]) -> Any:
+        if self.ttl <= 0:
+            return await fetch()
+        if time.monotonic() < self._expires:
+            return self._value
+        if self._lock is None:
+            self._lock = asyncio.Lock()
+        async with self._lock:
+            if time.monotonic() >= self._expires:
+                self._value = await fetch()
+                self._expires = time.monotonic() + self.ttl
+        return self._value
+
+
+# Liveness probes can hit /health far more often than ServiceNow needs checking
+_HEALTH_TTL = float(os.getenv("HEALTH_TTL_SEC", "5"))
+_health_cache = _AsyncTTLCache(_HEALTH_TTL)
+_health_details_cache = _AsyncTTLCache(_HEALTH_TTL)
+_health_sample_cache = _AsyncTTLCache(_HEALTH_TTL)
+
+
+# Probes hit /health constantly and it only has two possible bodies
+_HEALTH_UP = b'{"status":true}'
+_HEALTH_DOWN = b'{"status":false}'
+
+
+@app.get("/health", response_model=Dict[str, bool])
+async def health_check() -> Response:
     """Check server health and ServiceNow connectivity"""
     try:
-        is_connected = await mcp_server.validate_connection()
-        return {"status": is_connected}
+        is_connected = await _health_cache.get(_get_mcp_server().validate_connection)
+        return Response(_HEALTH_UP if is_connected else _HEALTH_DOWN, media_type="application/json")
     except Exception as e:
         logger.exception("Health check failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 @app.get("/health/details")
-async def health_details() -> Dict[str, Any]:
-    """Detailed health info including any ServiceNow error details."""
+async def health_details(sample: bool = False) -> Dict[str, Any]:
+    """Detailed health info including any ServiceNow error details.
+
+    ``?sample=true`` also returns the parsed probe response.
+    """
     try:
-        return await mcp_server.validate_connection_details()
+        if sample:
+            return await _health_sample_cache.get(
+                partial(_get_mcp_server().validate_connection_details, include_sample=True)
+            )
+        return await _health_details_cache.get(_get_mcp_server().validate_connection_details)
     except Exception as e:
         logger.exception("Health details failed")
         raise HTTPException(status_code=500, detail=str(e))
 
 if __name__ == "__main__":
+    reload_enabled = _env_flag("UVICORN_RELOAD")
+    workers = int(os.getenv("UVICORN_WORKERS", "1"))
+    # uvicorn needs an import string to reload or spawn workers
     uvicorn.run(
-        app,
+        "main:app" if reload_enabled or workers > 1 else app,
         host=_resolve_host(),
         port=_resolve_port(),
-        reload=_env_flag("UVICORN_RELOAD", default=True),
+        reload=reload_enabled,
+        workers=workers,
     )
@@ -9,7 +9,7 @@ Provides:
 """
 from __future__ import annotations
 
-import inspect
+from functools import lru_cache
 from typing import Any, Dict, List, Optional, Type
 
 from pydantic import BaseModel
@@ -17,25 +17,7 @@ from pydantic import BaseModel
 
 JSONRPC_VERSION = "2.0"
 
-
-def _param_model_from_func(func) -> Optional[Type[BaseModel]]:
-    try:
-        sig = inspect.signature(func)
-        # We expect signature like (config, auth_manager, params_model)
-        params = list(sig.parameters.values())
-        if len(params) >= 3:
-            p = params[2]
-            ann = p.annotation
-            try:
-                if isinstance(ann, type) and issubclass(ann, BaseModel):
-                    return ann
-            except Exception:
-                return None
-    except Exception:
-        return None
-    return None
-
-
+@lru_cache(maxsize=None)
 def _tool_schema_from_model(model_cls: Optional[Type[BaseModel]]) -> Dict[str, Any]:
     if not model_cls:
         return {"type": "object"}
@@ -57,7 +39,10 @@ def jsonrpc_initialize_result(auth_required: bool = False) -> Dict[str, Any]:
 
 
 def jsonrpc_tools_list(mcp_server) -> List[Dict[str, Any]]:
-    """Build JSON-RPC style tool descriptors with input schema."""
+    """Build JSON-RPC style tool descriptors with input schema.
+
+    Not cached here; main._tools_list_result memoizes the result.
+    """
     tools = []
     for tool_name, meta in mcp_server.tool_metadata.items():
         module = mcp_server.tools.get(meta.get("module"))
@@ -66,9 +51,7 @@ def jsonrpc_tools_list(mcp_server) -> List[Dict[str, Any]]:
         operation = meta.get("operation")
         if not operation or not hasattr(module, operation):
             continue
-        func = getattr(module, operation)
-        model_cls = _param_model_from_func(func)
-        schema = _tool_schema_from_model(model_cls)
+        schema = _tool_schema_from_model(mcp_server.params_model(tool_name))
         tools.append({
             "name": tool_name,
             "description": meta.get("description", f"{tool_name} operation"),
@@ -81,6 +64,22 @@ def jsonrpc_ok(id_value: Any, result: Any) -> Dict[str, Any]:
     return {"jsonrpc": JSONRPC_VERSION, "id": id_value, "result": result}
 
 
+# Shared error objects for the common failure paths. They are only ever
+# serialized, so one instance is reused across responses; do not mutate.
+PARSE_ERROR = {"code": -32700, "message": "Parse error"}
+INVALID_REQUEST_OBJECT = {"code": -32600, "message": "Invalid Request: expected an object"}
+INVALID_REQUEST_VERSION = {"code": -32600, "message": "Invalid Request: missing jsonrpc 2.0"}
+INVALID_PARAMS_OBJECT = {"code": -32602, "message": "Invalid params: expected an object"}
+INVALID_PARAMS_NAME = {"code": -32602, "message": "Invalid params: name required"}
+INVALID_PARAMS_ARGUMENTS = {"code": -32602, "message": "Invalid params: arguments must be an object"}
+UNAUTHORIZED = {"code": -32001, "message": "Unauthorized"}
+
+
+def jsonrpc_error_const(id_value: Any, error: Dict[str, Any]) -> Dict[str, Any]:
+    """Wrap one of the shared error objects above in a response envelope."""
+    return {"jsonrpc": JSONRPC_VERSION, "id": id_value, "error": error}
+
+
 def jsonrpc_error(id_value: Any, code: int, message: str, data: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
     err: Dict[str, Any] = {"code": code, "message": message}
     if data is not None:
@@ -1,23 +1,23 @@
-# Supported operations in the MCP server
+# Supported operations in the MCP server (frozensets for O(1) membership checks)
 SUPPORTED_OPERATIONS = {
-    "servicenow.incident": [
+    "servicenow.incident": frozenset({
         "get",
-        "create", 
+        "create",
         "update",
         "list"
-    ],
-    "servicenow.catalog": [
+    }),
+    "servicenow.catalog": frozenset({
         "get_item",
         "list_items",
         "create_item",
         "update_item"
-    ],
-    "servicenow.change": [
+    }),
+    "servicenow.change": frozenset({
         "get_request",
         "create_request",
         "update_request",
         "list_requests"
-    ]
+    })
 }
 
 # Operation descriptions for documentation
@@ -34,4 +34,7 @@ OPERATION_DESCRIPTIONS = {
     "servicenow.change.create_request": "Create a new change request",
     "servicenow.change.update_request": "Update an existing change request",
     "servicenow.change.list_requests": "List change requests matching query parameters"
-}
\ No newline at end of file
+}
+
+# Fully-qualified operation names ("servicenow.incident.get", ...)
+ALL_OPERATIONS = frozenset(OPERATION_DESCRIPTIONS)
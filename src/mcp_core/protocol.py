@@ -12,6 +12,15 @@ class MCPRequest(BaseModel):
     tool: str
     parameters: Dict[str, Any]
 
+    @classmethod
+    def construct_internal(cls, id: str, tool: str, parameters: Dict[str, Any]) -> "MCPRequest":
+        """Build a request from already-checked values without re-validating.
+
+        Only for internal callers (e.g. the JSON-RPC bridge); external input
+        must go through normal validation.
+        """
+        return cls.model_construct(version="1.0", type="request", id=id, tool=tool, parameters=parameters)
+
 class MCPResponse(BaseModel):
     """MCP Response model following the protocol specification"""
     version: str
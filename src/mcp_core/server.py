@@ -1,14 +1,13 @@
 """
 ServiceNow MCP Server implementation for handling requests and tools.
 """
-import json
 import logging
-import os
 import inspect
-from pathlib import Path
-from typing import Dict, List, Any, Optional, Type
+import typing
+from functools import lru_cache, partial
+from typing import AsyncIterator, Awaitable, Callable, Dict, FrozenSet, List, Any, NamedTuple, Optional, Tuple, Type
 
-import yaml
+import orjson
 from pydantic import ValidationError, BaseModel
 
 from auth.auth_manager import AuthManager
@@ -27,6 +26,88 @@ from tools import (
 logger = logging.getLogger(__name__)
 
 
+class _ParamSpec(NamedTuple):
+    """How a tool function takes its request parameters.
+
+    Tools are called as ``fn(config, auth_manager, params)``. ``name`` is the
+    third parameter's name (None when it is missing or unannotated, in which
+    case parameters are passed as keyword arguments); ``model`` is its
+    Pydantic model, if it is annotated with one, and ``validate`` that
+    model's bound core validator.
+    """
+    name: Optional[str]
+    model: Optional[Type[BaseModel]]
+    validate: Optional[Callable[[Any], BaseModel]] = None
+
+
+class _ToolEntry(NamedTuple):
+    """Pre-resolved dispatch data for one tool.
+
+    ``func`` and ``stream_func`` already have the server's config and
+    client bound as their first two arguments.
+    """
+    func: Any
+    spec: _ParamSpec
+    required_params: FrozenSet[str]
+    stream_func: Optional[Any]
+
+
+_NO_ARGS: Tuple[()] = ()
+_NO_KWARGS: Dict[str, Any] = {}
+
+
+def _bind_params(
+    spec: _ParamSpec, parameters: Dict[str, Any]
+) -> Tuple[Tuple[Any, ...], Dict[str, Any]]:
+    """Build the (args, kwargs) a bound tool function takes after config and client."""
+    if spec.name is None:
+        # No typed params; pass through kwargs
+        return _NO_ARGS, parameters
+    if spec.validate is not None:
+        return (spec.validate(parameters),), _NO_KWARGS
+    # Fall back to passing the raw parameters dict as the params argument
+    return (parameters,), _NO_KWARGS
+
+
+def _missing_params_message(missing: FrozenSet[str]) -> str:
+    if len(missing) == 1:
+        return f"Missing required parameter: {next(iter(missing))}"
+    return f"Missing required parameters: {', '.join(sorted(missing))}"
+
+
+# OPERATIONS keys that describe how to call a tool; not part of /tools metadata
+_BINDING_KEYS = ("params_model", "params_arg_name")
+
+# Query for the single-row connectivity probe; shared, so never mutate it
+_PROBE_PARAMS: Dict[str, Any] = {"sysparm_limit": 1}
+
+
+def _model_spec(name: str, model: Optional[Type[BaseModel]]) -> _ParamSpec:
+    if model is None:
+        return _ParamSpec(name, None)
+    # Calling the core validator directly skips BaseModel.__init__'s kwargs
+    # repacking; it validates exactly as model(**params) would
+    return _ParamSpec(name, model, model.__pydantic_validator__.validate_python)
+
+
+@lru_cache(maxsize=None)
+def _param_spec(func: Any) -> _ParamSpec:
+    """Introspect a tool function's signature (fallback for undeclared tools)."""
+    params = list(inspect.signature(func).parameters.values())
+    if len(params) < 3 or params[2].annotation is inspect.Parameter.empty:
+        return _ParamSpec(None, None)
+    param = params[2]
+    ann = param.annotation
+    if isinstance(ann, str):
+        # Resolve string annotations (postponed evaluation / forward refs)
+        try:
+            ann = typing.get_type_hints(func).get(param.name, ann)
+        except Exception:
+            pass
+    model = ann if isinstance(ann, type) and issubclass(ann, BaseModel) else None
+    return _model_spec(param.name, model)
+
+
 class ServiceNowMCPServer:
     """
     ServiceNow MCP Server implementation.
@@ -46,6 +127,8 @@ class ServiceNowMCPServer:
         self.auth_manager = AuthManager(self.config.auth, self.config.instance_url)
         # Real HTTP client that tools can call (compatible with tests where a mock client is passed)
         self.http_client = ServiceNowClient(self.config, self.auth_manager)
+        # Connectivity probe target; built once since health checks call it often
+        self._sys_user_url = f"{self.config.api_url}/table/sys_user"
         
         # Initialize tool modules
         self.tools = {
@@ -59,7 +142,15 @@ class ServiceNowMCPServer:
 
         # Load tool metadata
         self.tool_metadata = self._load_tool_metadata()
-        logger.info(f"Loaded {len(self.tool_metadata)} tools")
+        # Callables and signature introspection per tool, resolved once rather
+        # than per request. Kept out of tool_metadata, which /tools serves as JSON.
+        self._dispatch = self._load_dispatch()
+        # One pre-bound coroutine per tool, so handle_request is a dict lookup
+        # and a call
+        self._handlers = {
+            tool_name: self._make_handler(entry) for tool_name, entry in self._dispatch.items()
+        }
+        logger.info("Loaded %d tools", len(self.tool_metadata))
 
     def _load_tool_metadata(self) -> Dict[str, Dict]:
         """
@@ -76,113 +167,99 @@ class ServiceNowMCPServer:
                     metadata[tool_name] = {
                         "module": module_name,
                         "operation": op_name,
-                        **op_meta
+                        **{k: v for k, v in op_meta.items() if k not in _BINDING_KEYS}
                     }
         return metadata
 
-    async def handle_request(self, request: MCPRequest) -> MCPResponse:
+    def _load_dispatch(self) -> Dict[str, _ToolEntry]:
         """
-        Handle an incoming MCP request.
+        Resolve each tool's callable and parameter binding once.
 
-        Args:
-            request: The MCP request to handle.
-
-        Returns:
-            The MCP response.
+        Tools declare ``params_model``/``params_arg_name`` in OPERATIONS so
+        nothing is introspected per request; undeclared tools fall back to
+        inspecting the signature here, at startup.
         """
-        try:
-            # Parse tool name and operation
-            if "." not in request.tool:
-                return MCPResponse(
-                    version=request.version,
-                    type="error",
-                    id=request.id,
-                    error="Invalid tool name format. Expected: module.operation"
+        dispatch: Dict[str, _ToolEntry] = {}
+        for module_name, module in self.tools.items():
+            for operation, op_meta in getattr(module, "OPERATIONS", {}).items():
+                func = getattr(module, operation, None)
+                if func is None:
+                    continue
+                if "params_arg_name" in op_meta:
+                    spec = _model_spec(op_meta["params_arg_name"], op_meta.get("params_model"))
+                else:
+                    try:
+                        spec = _param_spec(func)
+                    except (TypeError, ValueError):
+                        # Not introspectable; left to the slow path, which reports it
+                        continue
+                stream_func = getattr(module, f"{operation}_stream", None)
+                dispatch[f"{module_name}.{operation}"] = _ToolEntry(
+                    func=partial(func, self.config, self.http_client),
+                    spec=spec,
+                    required_params=frozenset(op_meta.get("required_params", ())),
+                    stream_func=(
+                        partial(stream_func, self.config, self.http_client)
+                        if stream_func is not None else None
+                    ),
                 )
+        return dispatch
 
-            module_name, operation = request.tool.split(".", 1)
-            
-            # Check if module exists
-            if module_name not in self.tools:
-                return MCPResponse(
-                    version=request.version,
-                    type="error",
-                    id=request.id,
-                    error=f"Unknown module: {module_name}"
-                )
+    def params_model(self, tool_name: str) -> Optional[Type[BaseModel]]:
+        """Return the Pydantic params model for a tool, if it has one."""
+        entry = self._dispatch.get(tool_name)
+        return entry.spec.model if entry else None
 
-            # Check if operation exists
-            module = self.tools[module_name]
-            if not hasattr(module, operation):
-                return MCPResponse(
-                    version=request.version,
-                    type="error",
-                    id=request.id,
-                    error=f"Unknown operation: {operation} in module {module_name}"
-                )
+    @staticmethod
+    def _error(request: MCPRequest, message: str) -> MCPResponse:
+        # version/id come from the validated request and the message is ours,
+        # so field validation would only re-check known-good values
+        return MCPResponse.model_construct(
+            version=request.version,
+            type="error",
+            id=request.id,
+            error=message
+        )
 
-            # Get operation metadata
-            tool_name = f"{module_name}.{operation}"
-            metadata = self.tool_metadata.get(tool_name)
-            if not metadata:
-                return MCPResponse(
-                    version=request.version,
-                    type="error",
-                    id=request.id,
-                    error=f"No metadata found for tool: {tool_name}"
-                )
+    def _lookup(self, request: MCPRequest) -> Tuple[Optional[_ToolEntry], Optional[str]]:
+        """
+        Find the dispatch entry for a request and check required parameters.
 
-            # Validate required parameters
-            required_params = metadata.get("required_params", [])
-            for param in required_params:
-                if param not in request.parameters:
-                    return MCPResponse(
-                        version=request.version,
-                        type="error",
-                        id=request.id,
-                        error=f"Missing required parameter: {param}"
-                    )
+        Returns:
+            (entry, error); exactly one of them is None.
+        """
+        entry = self._dispatch.get(request.tool)
+        if entry is None:
+            return None, self._unknown_tool_error(request)
 
-            # Execute operation
-            operation_func = getattr(module, operation)
+        # Validate required parameters
+        missing = entry.required_params - request.parameters.keys()
+        if missing:
+            return None, _missing_params_message(missing)
+        return entry, None
+
+    def _make_handler(self, entry: _ToolEntry) -> Callable[[MCPRequest], Awaitable[MCPResponse]]:
+        """Build the request handler for one tool from its dispatch entry."""
+        func = entry.func
+        spec = entry.spec
+        required_params = entry.required_params
+        bind_params = _bind_params
+        error = self._error
+
+        async def handler(request: MCPRequest) -> MCPResponse:
+            parameters = request.parameters
+            missing = required_params - parameters.keys()
+            if missing:
+                return error(request, _missing_params_message(missing))
 
             # Build a params model instance if the function expects one
-            bound_params: Dict[str, Any] = {
-                "config": self.config,
-                "auth_manager": self.http_client,
-            }
             try:
-                sig = inspect.signature(operation_func)
-                params_param = None
-                for name, param in list(sig.parameters.items())[2:3]:  # third parameter
-                    params_param = param
-                    break
-                if params_param is not None and params_param.annotation is not inspect._empty:
-                    ann = params_param.annotation
-                    model_cls: Optional[Type[BaseModel]] = None
-                    try:
-                        # Pydantic BaseModel subclass?
-                        if isinstance(ann, type) and issubclass(ann, BaseModel):
-                            model_cls = ann
-                    except Exception:
-                        model_cls = None
-                    if model_cls:
-                        bound_params[params_param.name] = model_cls(**request.parameters)
-                    else:
-                        # Fall back to passing raw parameters dict under expected name
-                        bound_params[params_param.name] = request.parameters
-                else:
-                    # No typed params; pass through kwargs
-                    bound_params.update(request.parameters)
+                args, kwargs = bind_params(spec, parameters)
             except Exception as e:
-                return MCPResponse(
-                    version=request.version,
-                    type="error",
-                    id=request.id,
-                    error=f"Parameter binding failed: {str(e)}"
-                )
+                return error(request, f"Parameter binding failed: {str(e)}")
 
-            result = await operation_func(**bound_params)
+            # Execute operation
+            result = await func(*args, **kwargs)
 
             return MCPResponse(
                 version=request.version,
@@ -191,21 +268,97 @@ class ServiceNowMCPServer:
                 result=result
             )
 
+        return handler
+
+    def _unknown_tool_error(self, request: MCPRequest) -> str:
+        """Explain why a tool name has no dispatch entry (slow path)."""
+        # Parse tool name and operation
+        module_name, sep, operation = request.tool.partition(".")
+        if not sep:
+            return "Invalid tool name format. Expected: module.operation"
+
+        # Check if module exists
+        if module_name not in self.tools:
+            return f"Unknown module: {module_name}"
+
+        # Check if operation exists
+        module = self.tools[module_name]
+        if not hasattr(module, operation):
+            return f"Unknown operation: {operation} in module {module_name}"
+
+        tool_name = f"{module_name}.{operation}"
+        if tool_name not in self.tool_metadata:
+            return f"No metadata found for tool: {tool_name}"
+        return f"Parameter binding failed: cannot inspect signature of {tool_name}"
+
+    async def handle_request(self, request: MCPRequest) -> MCPResponse:
+        """
+        Handle an incoming MCP request.
+
+        Args:
+            request: The MCP request to handle.
+
+        Returns:
+            The MCP response.
+        """
+        handler = self._handlers.get(request.tool)
+        if handler is None:
+            return self._error(request, self._unknown_tool_error(request))
+        try:
+            return await handler(request)
         except ValidationError as e:
-            return MCPResponse(
-                version=request.version,
-                type="error",
-                id=request.id,
-                error=f"Invalid parameters: {str(e)}"
-            )
+            return self._error(request, f"Invalid parameters: {str(e)}")
         except Exception as e:
             logger.exception(f"Error handling request: {e}")
-            return MCPResponse(
-                version=request.version,
-                type="error",
-                id=request.id,
-                error=f"Internal server error: {str(e)}"
-            )
+            return self._error(request, f"Internal server error: {str(e)}")
+
+    async def stream_request(self, request: MCPRequest) -> AsyncIterator[MCPResponse]:
+        """
+        Handle an MCP request, yielding partial results as they are produced.
+
+        Tools opt in by defining an async generator ``<operation>_stream``
+        next to the operation, taking the same params as the operation. Other tools yield a
+        single response from handle_request. Errors are yielded as a final
+        error response.
+
+        Args:
+            request: The MCP request to handle.
+
+        Yields:
+            One MCP response per result chunk.
+        """
+        entry, error = self._lookup(request)
+        if error:
+            yield self._error(request, error)
+            return
+        stream_func = entry.stream_func
+        if stream_func is None:
+            yield await self.handle_request(request)
+            return
+
+        try:
+            args, kwargs = _bind_params(entry.spec, request.parameters)
+        except Exception as e:
+            yield self._error(request, f"Parameter binding failed: {str(e)}")
+            return
+
+        try:
+            async for chunk in stream_func(*args, **kwargs):
+                yield MCPResponse(
+                    version=request.version,
+                    type="response",
+                    id=request.id,
+                    result=chunk
+                )
+        except Exception as e:
+            logger.exception(f"Error streaming request: {e}")
+            yield self._error(request, f"Internal server error: {str(e)}")
+
+    async def aclose(self) -> None:
+        """Release network resources held by the server."""
+        await self.http_client.aclose()
+        await self.auth_manager.aclose()
+        await catalogue_builder.aclose_clients()
 
     async def list_tools(self) -> Dict[str, Any]:
         """
@@ -229,9 +382,7 @@ class ServiceNowMCPServer:
         try:
             # Perform a lightweight request to validate connectivity and auth
             try:
-                resp = await self.http_client.get(
-                    f"{self.config.api_url}/table/sys_user", params={"sysparm_limit": 1}
-                )
+                resp = await self.http_client.get(self._sys_user_url, params=_PROBE_PARAMS)
                 # If request succeeded (2xx), consider healthy. JSON parse not required.
                 _ = resp.status_code  # ensure response object
                 return True
@@ -241,21 +392,27 @@ class ServiceNowMCPServer:
             logger.error(f"Connection validation failed: {e}")
             return False
 
-    async def validate_connection_details(self) -> Dict[str, Any]:
-        """Detailed connectivity check including error information."""
-        url = f"{self.config.api_url}/table/sys_user"
+    async def validate_connection_details(self, include_sample: bool = False) -> Dict[str, Any]:
+        """
+        Detailed connectivity check including error information.
+
+        Args:
+            include_sample: Parse the probe response into ``details["sample"]``;
+                off by default so routine checks skip the JSON decode.
+        """
+        url = self._sys_user_url
         details: Dict[str, Any] = {"status": False, "url": url}
         try:
-            resp = await self.http_client.get(url, params={"sysparm_limit": 1})
+            resp = await self.http_client.get(url, params=_PROBE_PARAMS)
             details.update({
                 "status": True,
                 "http_status": getattr(resp, "status_code", None),
             })
-            try:
-                body = resp.json()
-                details["sample"] = body
-            except Exception:
-                details["sample"] = None
+            if include_sample:
+                try:
+                    details["sample"] = orjson.loads(resp.content)
+                except Exception:
+                    details["sample"] = None
             return details
         except Exception as e:
             # Try to extract status code/message if available
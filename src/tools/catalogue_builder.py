@@ -2,11 +2,20 @@
 Catalog Builder tools for ServiceNow MCP integration.
 Handles service catalog and category management.
 """
+import asyncio
 import logging
-from typing import Any, Dict, List, Optional
+import os
+import time
+import types
+import weakref
+from collections import OrderedDict
+from datetime import datetime, timezone
+from email.utils import formatdate, parsedate_to_datetime
+from typing import Any, AsyncIterator, Dict, List, Optional, Tuple
 
 import httpx
 import inspect
+import orjson
 from pydantic import BaseModel, Field
 
 from auth.auth_manager import AuthManager
@@ -25,6 +34,21 @@ FIELD_LENGTHS = {
 logger = logging.getLogger(__name__)
 
 
+# Whether instances of a type are awaitable, filled in on first sight. Plain
+# generators are left out: only some (@types.coroutine ones) are awaitable
+_AWAITABLE_TYPES: Dict[type, bool] = {}
+
+
+def _is_awaitable(value: Any) -> bool:
+    cls = type(value)
+    awaitable = _AWAITABLE_TYPES.get(cls)
+    if awaitable is None:
+        awaitable = inspect.isawaitable(value)
+        if cls is not types.GeneratorType:
+            _AWAITABLE_TYPES[cls] = awaitable
+    return awaitable
+
+
 async def _maybe_await(callable_or_awaitable, *args, **kwargs):
     """Call a function and await the result if it is awaitable.
 
@@ -37,19 +61,75 @@ async def _maybe_await(callable_or_awaitable, *args, **kwargs):
         # Propagate exceptions from the underlying call (e.g., raise_for_status)
         raise
     for _ in range(2):
-        if inspect.isawaitable(result):
+        if _is_awaitable(result):
             result = await result
         else:
             break
     return result
 
 
+async def _json_body(response: Any) -> Any:
+    """Decode a response body as JSON.
+
+    Real httpx responses are decoded from their raw bytes with orjson;
+    anything else (test doubles) goes through its own json() method.
+    """
+    if isinstance(response, httpx.Response):
+        return orjson.loads(response.content)
+    return await _maybe_await(response.json)
+
+# Headers per auth manager, reused until the token expires (or a default TTL
+# for static credentials): {manager: (headers, expires_at)}. Weak keys, so a
+# discarded manager takes its entry with it
+_AUTH_HEADER_TTL = 300.0
+_auth_header_cache: "weakref.WeakKeyDictionary[Any, Tuple[Dict[str, str], float]]" = weakref.WeakKeyDictionary()
+
+
+def _auth_header_ttl(auth_manager: Any) -> float:
+    """Seconds the manager's current headers stay valid."""
+    expiry = getattr(auth_manager, "token_expiry", None)
+    if isinstance(expiry, datetime):
+        now = datetime.now(expiry.tzinfo) if expiry.tzinfo else datetime.now()
+        return min(_AUTH_HEADER_TTL, (expiry - now).total_seconds())
+    expires_in = getattr(auth_manager, "expires_in", None)
+    if isinstance(expires_in, (int, float)) and not isinstance(expires_in, bool):
+        return min(_AUTH_HEADER_TTL, float(expires_in))
+    return _AUTH_HEADER_TTL
+
+
+def _auth_source(auth_manager: Any) -> Any:
+    """The object holding the header getters; unwraps e.g. ServiceNowClient."""
+    if hasattr(auth_manager, "aget_headers") or hasattr(auth_manager, "get_headers"):
+        return auth_manager
+    return getattr(auth_manager, "auth_manager", auth_manager)
+
+
+def _drop_auth_headers(auth_manager: Any) -> None:
+    """Forget cached headers after ServiceNow rejected them (401)."""
+    try:
+        _auth_header_cache.pop(_auth_source(auth_manager), None)
+    except TypeError:
+        pass
+
+
 async def _get_auth_headers(auth_manager: AuthManager) -> Dict[str, str]:
     """Get auth headers supporting both async and sync getters.
 
-    Tries `aget_headers` then `get_headers`, awaiting as needed.
+    Tries `aget_headers` then `get_headers`, awaiting as needed; a client
+    wrapping an auth manager (e.g. ServiceNowClient) is unwrapped first.
+    Headers are cached per manager until the token expires (or a 401
+    drops them), and a copy is returned so callers may add to it.
     Ensures a dict is returned.
     """
+    auth_manager = _auth_source(auth_manager)
+    try:
+        cached = _auth_header_cache.get(auth_manager)
+    except TypeError:
+        # Not weak-referenceable; fetch every time
+        cached = None
+    if cached is not None and time.monotonic() < cached[1]:
+        return dict(cached[0])
+
     headers: Any = {}
     getter = None
     if hasattr(auth_manager, "aget_headers"):
@@ -61,9 +141,133 @@ async def _get_auth_headers(auth_manager: AuthManager) -> Dict[str, str]:
             headers = await _maybe_await(getter)
         except Exception:
             headers = {}
-    if not isinstance(headers, dict):
-        headers = {}
-    return headers
+    if not isinstance(headers, dict) or not headers:
+        return {}
+    ttl = _auth_header_ttl(auth_manager)
+    if ttl > 0:
+        try:
+            _auth_header_cache[auth_manager] = (dict(headers), time.monotonic() + ttl)
+        except TypeError:
+            pass
+    return dict(headers)
+
+
+# One pooled client per instance, shared by every catalog call so connections
+# are kept alive between calls; closed by aclose_clients() at shutdown
+_CLIENT_LIMITS = httpx.Limits(
+    max_keepalive_connections=20,
+    max_connections=100,
+    keepalive_expiry=60.0
+)
+_clients: Dict[Tuple[str, int], httpx.AsyncClient] = {}
+
+
+def _get_client(config: ServerConfig) -> httpx.AsyncClient:
+    """Return the shared client for config's instance, creating it on first use."""
+    key = (config.instance_url, config.timeout)
+    client = _clients.get(key)
+    if client is None:
+        client = _clients[key] = httpx.AsyncClient(
+            timeout=config.timeout,
+            verify=True,  # Enforce SSL verification
+            http2=False,  # Disable HTTP/2 to avoid h2 dependency
+            limits=_CLIENT_LIMITS,
+        )
+    return client
+
+
+async def aclose_clients() -> None:
+    """Close the shared catalog clients."""
+    clients = list(_clients.values())
+    _clients.clear()
+    for client in clients:
+        await client.aclose()
+
+
+# Catalog reads are reused for as long as ServiceNow's Cache-Control/Expires
+# allow, or for CATALOG_CACHE_TTL_SEC when it sends neither (0 disables)
+_CATALOG_CACHE_TTL = float(os.getenv("CATALOG_CACHE_TTL_SEC", "30"))
+_CATALOG_CACHE_SIZE = 1024
+_catalog_cache: "OrderedDict[Tuple[Any, ...], Tuple[float, Any]]" = OrderedDict()
+
+
+def _catalog_cache_key(
+    config: ServerConfig, auth_manager: AuthManager, operation: str, params: BaseModel
+) -> Tuple[Any, ...]:
+    return (config.instance_url, id(auth_manager), operation, *params.model_dump().values())
+
+
+def _response_ttl(headers: Any) -> float:
+    """Seconds a ServiceNow response may be reused, per its caching headers."""
+    cache_control = headers.get("Cache-Control")
+    if cache_control:
+        directives = [d.strip().lower() for d in cache_control.split(",")]
+        if "no-store" in directives or "no-cache" in directives:
+            return 0.0
+        for directive in directives:
+            name, _, value = directive.partition("=")
+            if name == "max-age":
+                try:
+                    return max(0.0, float(value))
+                except ValueError:
+                    return 0.0
+    expires = headers.get("Expires")
+    if expires:
+        try:
+            return max(0.0, (parsedate_to_datetime(expires) - datetime.now(timezone.utc)).total_seconds())
+        except (TypeError, ValueError):
+            # Includes the common "Expires: 0", meaning already expired
+            return 0.0
+    return _CATALOG_CACHE_TTL
+
+
+def _freeze(value: Any) -> Any:
+    """Serialize a result for the cache, so no caller can mutate the cached copy."""
+    if isinstance(value, CatalogResponse):
+        return (CatalogResponse, value.success, value.message, orjson.dumps(value.data))
+    return (dict, orjson.dumps(value))
+
+
+def _thaw(frozen: Any) -> Any:
+    """Rebuild a fresh result from its cached form."""
+    if frozen[0] is CatalogResponse:
+        _, success, message, data = frozen
+        return CatalogResponse.model_construct(success=success, message=message, data=orjson.loads(data))
+    return orjson.loads(frozen[1])
+
+
+def _cache_get(key: Tuple[Any, ...]) -> Any:
+    entry = _catalog_cache.get(key)
+    if entry is None:
+        return None
+    expires, frozen = entry
+    if time.monotonic() >= expires:
+        del _catalog_cache[key]
+        return None
+    _catalog_cache.move_to_end(key)
+    return _thaw(frozen)
+
+
+def _cache_put(key: Tuple[Any, ...], value: Any, headers: Any) -> None:
+    if _CATALOG_CACHE_TTL <= 0:
+        return
+    ttl = _response_ttl(headers)
+    if ttl <= 0:
+        return
+    try:
+        frozen = _freeze(value)
+    except TypeError:
+        # Not plain JSON data; leave it uncached
+        return
+    _catalog_cache[key] = (time.monotonic() + ttl, frozen)
+    _catalog_cache.move_to_end(key)
+    if len(_catalog_cache) > _CATALOG_CACHE_SIZE:
+        _catalog_cache.popitem(last=False)
+
+
+def _invalidate_catalog_cache() -> None:
+    """Drop cached reads after a write; lists may include the changed record."""
+    _catalog_cache.clear()
 
 
 class ListCatalogItemsParams(BaseModel):
@@ -130,13 +334,30 @@ class UpdateCatalogCategoryParams(BaseModel):
 
 
 class CatalogResponse(BaseModel):
-    """Response from catalog operations."""
+    """Response from catalog operations.
+
+    Built with ``model_construct`` below: every field is set from values
+    produced in this module, so a second validation pass is skipped.
+    """
 
     success: bool = Field(..., description="Whether the operation was successful")
     message: str = Field(..., description="Message describing the result")
     data: Optional[Dict[str, Any]] = Field(None, description="Response data")
 
 
+# Content and security headers added to every list_catalog_items request
+_SECURITY_HEADERS = {
+    "Accept": "application/json",
+    "Content-Type": "application/json",
+    "X-Content-Type-Options": "nosniff",
+    "X-Frame-Options": "DENY",
+    "X-XSS-Protection": "1; mode=block"
+}
+
+# Encoded-query operators stripped from user-supplied filter values
+_QUERY_STRIP = str.maketrans("", "", "^=")
+
+
 async def list_catalog_items(
     config: ServerConfig,
     auth_manager: AuthManager,
@@ -154,7 +375,14 @@ async def list_catalog_items(
         Dictionary containing catalog items and metadata
     """
     logger.info("Listing service catalog items with params: %s", params)
-    
+    cache_key = _catalog_cache_key(config, auth_manager, "list_catalog_items", params)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        # timestamp/request_id describe a ServiceNow reply; a hit made no request
+        cached["timestamp"] = formatdate(usegmt=True)
+        cached["request_id"] = ""
+        return cached
+
     try:
         logger.debug("Building query parameters...")
         # Build base query parameters with security defaults
@@ -172,14 +400,14 @@ async def list_catalog_items(
         # Add sanitized category filter if specified
         if params.category:
             # Remove potential injection characters
-            safe_category = params.category.replace('^', '').replace('=', '')
+            safe_category = params.category.translate(_QUERY_STRIP)
             filters.append(f"cat_item.category={safe_category}")
             logger.debug("Added sanitized category filter: %s", safe_category)
             
         # Add sanitized search query if specified
         if params.query:
             # Escape special characters and limit query length
-            safe_query = params.query.replace('^', '').replace('=', '')[:100]
+            safe_query = params.query.translate(_QUERY_STRIP)[:100]
             filters.append(f"nameLIKE{safe_query}^ORshort_descriptionLIKE{safe_query}")
             logger.debug("Added sanitized search filter: %s", safe_query)
 
@@ -193,78 +421,63 @@ async def list_catalog_items(
 
         # Get and enhance authentication headers (support async/sync)
         headers = await _get_auth_headers(auth_manager)
-        headers.update({
-            "Accept": "application/json",
-            "Content-Type": "application/json",
-            # Add security headers
-            "X-Content-Type-Options": "nosniff",
-            "X-Frame-Options": "DENY",
-            "X-XSS-Protection": "1; mode=block"
-        })
+        headers.update(_SECURITY_HEADERS)
         
         logger.debug("Making API request...")
         # Configure HTTP client with security settings
-        async with httpx.AsyncClient(
-            timeout=config.timeout,
-            verify=True,  # Enforce SSL verification
-            http2=False,  # Disable HTTP/2 to avoid h2 dependency
-            limits=httpx.Limits(
-                max_keepalive_connections=5,
-                max_connections=10,
-                keepalive_expiry=5.0
-            )
-        ) as client:
-            logger.debug("Sending GET request...")
-            response = await _maybe_await(client.get,
-                f"{config.instance_url}/api/now/v1/servicecatalog/items",
-                params=query_params,
-                headers=headers
-            )
-            # Some mocks may return an awaitable that yields the response
-            logger.debug("Got response, checking status...")
-            await _maybe_await(response.raise_for_status)
-            
-            logger.debug("Getting response JSON...")
-            json_data = await _maybe_await(response.json)
-            if not isinstance(json_data, dict):
-                logger.error("Invalid response format - not a dict: %s", type(json_data))
-                raise ValueError("Invalid response format: not a dictionary")
-                
-            result = json_data.get("result", [])
-            if not isinstance(result, list):
-                logger.error("Invalid result format - not a list: %s", type(result))
-                raise ValueError("Invalid result format: not a list")
-            
-            # Sanitize and validate each item
-            sanitized_items = []
-            for item in result:
-                if isinstance(item, dict):
-                    # Sanitize and type-check each field
-                    sanitized_item = {
-                        "sys_id": str(item.get("sys_id", ""))[:32],  # Limit sys_id length
-                        "name": str(item.get("name", ""))[:255],  # Limit name length
-                        "short_description": str(item.get("short_description", ""))[:1000],
-                        "category": str(item.get("category", "")),
-                        "active": bool(item.get("active", False)),
-                        "created": str(item.get("sys_created_on", "")),
-                        "updated": str(item.get("sys_updated_on", ""))
-                    }
-                    sanitized_items.append(sanitized_item)
+        client = _get_client(config)
+        logger.debug("Sending GET request...")
+        response = await _maybe_await(client.get,
+            f"{config.instance_url}/api/now/v1/servicecatalog/items",
+            params=query_params,
+            headers=headers
+        )
+        # Some mocks may return an awaitable that yields the response
+        logger.debug("Got response, checking status...")
+        await _maybe_await(response.raise_for_status)
+        
+        logger.debug("Getting response JSON...")
+        json_data = await _json_body(response)
+        if not isinstance(json_data, dict):
+            logger.error("Invalid response format - not a dict: %s", type(json_data))
+            raise ValueError("Invalid response format: not a dictionary")
             
-            response_data = {
-                "items": sanitized_items,
-                "count": len(sanitized_items),
-                "total": max(0, int(response.headers.get("X-Total-Count", "0"))),  # Ensure non-negative
-                "hasMore": len(sanitized_items) >= params.limit if params.limit > 0 else False,
-                "timestamp": str(response.headers.get("Date", "")),
-                "request_id": str(response.headers.get("X-Request-ID", ""))
+        result = json_data.get("result", [])
+        if not isinstance(result, list):
+            logger.error("Invalid result format - not a list: %s", type(result))
+            raise ValueError("Invalid result format: not a list")
+        
+        # Sanitize and type-check each field of each item
+        sanitized_items = [
+            {
+                "sys_id": str(item.get("sys_id", ""))[:32],  # Limit sys_id length
+                "name": str(item.get("name", ""))[:255],  # Limit name length
+                "short_description": str(item.get("short_description", ""))[:1000],
+                "category": str(item.get("category", "")),
+                "active": bool(item.get("active", False)),
+                "created": str(item.get("sys_created_on", "")),
+                "updated": str(item.get("sys_updated_on", ""))
             }
-            logger.debug("Returning sanitized response data")
-            return response_data
-            
+            for item in result
+            if isinstance(item, dict)
+        ]
+        
+        response_data = {
+            "items": sanitized_items,
+            "count": len(sanitized_items),
+            "total": max(0, int(response.headers.get("X-Total-Count", "0"))),  # Ensure non-negative
+            "hasMore": len(sanitized_items) >= params.limit if params.limit > 0 else False,
+            "timestamp": str(response.headers.get("Date", "")),
+            "request_id": str(response.headers.get("X-Request-ID", ""))
+        }
+        logger.debug("Returning sanitized response data")
+        _cache_put(cache_key, response_data, response.headers)
+        return response_data
+        
     except httpx.HTTPStatusError as e:
         logger.error("HTTP error listing catalog items: %s", str(e))
         if e.response.status_code == 401:
+            _drop_auth_headers(auth_manager)
             raise ValueError("Authentication failed (401)")
         elif e.response.status_code == 403:
             raise ValueError("Not authorized to list catalog items")
@@ -280,6 +493,42 @@ async def list_catalog_items(
         raise ValueError(f"Unexpected error while listing catalog items: {str(e)}")
 
 
+# Page size for list_catalog_items_stream
+_STREAM_PAGE_SIZE = 100
+
+
+async def list_catalog_items_stream(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: ListCatalogItemsParams,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream service catalog items from ServiceNow one page at a time.
+
+    Args:
+        config: Server configuration
+        auth_manager: Authentication manager
+        params: Parameters for listing catalog items; limit caps the total streamed
+
+    Yields:
+        list_catalog_items results, one per page
+    """
+    remaining = params.limit
+    offset = params.offset
+    while remaining > 0:
+        page_params = params.model_copy(update={"limit": min(remaining, _STREAM_PAGE_SIZE), "offset": offset})
+        page = await list_catalog_items(config, auth_manager, page_params)
+        yield page
+        if not page["hasMore"]:
+            break
+        remaining -= page["count"]
+        offset += page["count"]
+
+
+# In-flight get_catalog_item lookups, keyed by (instance, auth manager, item id)
+_inflight_item_lookups: Dict[Tuple[str, int, str], "asyncio.Future[CatalogResponse]"] = {}
+
+
 async def get_catalog_item(
     config: ServerConfig,
     auth_manager: AuthManager,
@@ -288,6 +537,9 @@ async def get_catalog_item(
     """
     Get a specific service catalog item from ServiceNow.
 
+    Concurrent lookups of the same item share one pair of ServiceNow
+    requests; callers that arrive while a lookup is in flight await its result.
+
     Args:
         config: Server configuration
         auth_manager: Authentication manager
@@ -296,69 +548,112 @@ async def get_catalog_item(
     Returns:
         Response containing the catalog item details
     """
-    logger.info(f"Getting service catalog item: {params.item_id}")
+    cached = _cache_get(_catalog_cache_key(config, auth_manager, "get_catalog_item", params))
+    if cached is not None:
+        return cached
+
+    key = (config.instance_url, id(auth_manager), params.item_id)
+    pending = _inflight_item_lookups.get(key)
+    if pending is not None:
+        logger.debug("Joining in-flight lookup for catalog item %s", params.item_id)
+        # Shielded so one caller being cancelled does not cancel the others
+        result = await asyncio.shield(pending)
+        # The first caller holds the original; never share a mutable result
+        return result.model_copy(deep=True)
+
+    task = asyncio.ensure_future(_fetch_catalog_item(config, auth_manager, params))
+    _inflight_item_lookups[key] = task
+    try:
+        return await asyncio.shield(task)
+    finally:
+        if _inflight_item_lookups.get(key) is task:
+            del _inflight_item_lookups[key]
+
+
+async def _fetch_catalog_item(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: GetCatalogItemParams,
+) -> CatalogResponse:
+    """Fetch a catalog item and its variables; see get_catalog_item."""
+    logger.info("Getting service catalog item: %s", params.item_id)
     
     try:
         # Get authentication headers (support async/sync)
         headers = await _get_auth_headers(auth_manager)
         
-        # Make the API request for the item details
-        async with httpx.AsyncClient(timeout=config.timeout) as client:
-            response = await _maybe_await(client.get,
-                f"{config.instance_url}/api/now/v1/servicecatalog/items/{params.item_id}",
-                params={"sysparm_display_value": "true"},
-                headers=headers
-            )
+        # The item and its variables don't depend on each other; request both
+        # at once and drop the variables request if the item lookup fails
+        item_url = f"{config.instance_url}/api/now/v1/servicecatalog/items/{params.item_id}"
+        client = _get_client(config)
+        item_task = asyncio.ensure_future(_maybe_await(client.get,
+            item_url,
+            params={"sysparm_display_value": "true"},
+            headers=headers
+        ))
+        fields_task = asyncio.ensure_future(_maybe_await(client.get,
+            f"{item_url}/variables",
+            headers=headers
+        ))
+        try:
+            response = await item_task
             await _maybe_await(response.raise_for_status)
             
-            data = await _maybe_await(response.json)
+            data = await _json_body(response)
             item = data.get("result")
             
             if not item:
-                return CatalogResponse(
+                return CatalogResponse.model_construct(
                     success=False,
                     message=f"Catalog item {params.item_id} not found",
                     data=None
                 )
             
-            # Get variables/fields for the catalog item
-            fields_response = await _maybe_await(client.get,
-                f"{config.instance_url}/api/now/v1/servicecatalog/items/{params.item_id}/variables",
-                headers=headers
-            )
-            await _maybe_await(fields_response.raise_for_status)
-            
-            fields_data = await _maybe_await(fields_response.json)
-            item["variables"] = fields_data.get("result", [])
-                
-            return CatalogResponse(
-                success=True,
-                message=f"Successfully retrieved catalog item {params.item_id}",
-                data={"item": item}
-            )
-            
+            fields_response = await fields_task
+        finally:
+            fields_task.cancel()
+            # Retrieve the outcome so a failed, unused request is not reported
+            await asyncio.gather(fields_task, return_exceptions=True)
+        await _maybe_await(fields_response.raise_for_status)
+        
+        fields_data = await _json_body(fields_response)
+        item["variables"] = fields_data.get("result", [])
+
+        result = CatalogResponse.model_construct(
+            success=True,
+            message=f"Successfully retrieved catalog item {params.item_id}",
+            data={"item": item}
+        )
+        _cache_put(
+            _catalog_cache_key(config, auth_manager, "get_catalog_item", params),
+            result,
+            response.headers,
+        )
+        return result
+        
     except httpx.HTTPStatusError as e:
         logger.error("HTTP error getting catalog item: %s", str(e))
         if e.response.status_code == 401:
-            return CatalogResponse(
+            _drop_auth_headers(auth_manager)
+            return CatalogResponse.model_construct(
                 success=False,
                 message="Authentication failed (401)",
                 data=None
             )
         elif e.response.status_code == 403:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message="Not authorized to view this catalog item",
                 data=None
             )
         elif e.response.status_code == 404:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message=f"Catalog item {params.item_id} not found",
                 data=None
             )
         else:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message=f"Failed to get catalog item: {e.response.text}",
                 data=None
@@ -366,7 +661,7 @@ async def get_catalog_item(
             
     except (httpx.TimeoutException, httpx.NetworkError) as e:
         logger.error("Network error getting catalog item: %s", str(e))
-        return CatalogResponse(
+        return CatalogResponse.model_construct(
             success=False,
             message=f"Network error while getting catalog item: {str(e)}",
             data=None
@@ -374,7 +669,7 @@ async def get_catalog_item(
         
     except Exception as e:
         logger.exception("Unexpected error getting catalog item")
-        return CatalogResponse(
+        return CatalogResponse.model_construct(
             success=False,
             message=f"Unexpected error while getting catalog item: {str(e)}",
             data=None
@@ -418,46 +713,48 @@ async def create_catalog_item(
         headers = await _get_auth_headers(auth_manager)
         
         # Make the API request
-        async with httpx.AsyncClient(timeout=config.timeout) as client:
-            response = await _maybe_await(client.post,
-                f"{config.instance_url}/api/now/v1/servicecatalog/items",
-                json=payload,
-                headers=headers
-            )
-            await _maybe_await(response.raise_for_status)
-            
-            data = await _maybe_await(response.json)
-            item = data.get("result")
-            
-            if not item:
-                return CatalogResponse(
-                    success=False,
-                    message="Failed to create catalog item - no response data",
-                    data=None
-                )
-                
-            return CatalogResponse(
-                success=True,
-                message=f"Successfully created catalog item: {item.get('sys_id')}",
-                data={"item": item}
+        client = _get_client(config)
+        response = await _maybe_await(client.post,
+            f"{config.instance_url}/api/now/v1/servicecatalog/items",
+            json=payload,
+            headers=headers
+        )
+        await _maybe_await(response.raise_for_status)
+        
+        data = await _json_body(response)
+        item = data.get("result")
+        
+        if not item:
+            return CatalogResponse.model_construct(
+                success=False,
+                message="Failed to create catalog item - no response data",
+                data=None
             )
             
+        _invalidate_catalog_cache()
+        return CatalogResponse.model_construct(
+            success=True,
+            message=f"Successfully created catalog item: {item.get('sys_id')}",
+            data={"item": item}
+        )
+        
     except httpx.HTTPStatusError as e:
         logger.error("HTTP error creating catalog item: %s", str(e))
         if e.response.status_code == 401:
-            return CatalogResponse(
+            _drop_auth_headers(auth_manager)
+            return CatalogResponse.model_construct(
                 success=False,
                 message="Authentication failed",
                 data=None
             )
         elif e.response.status_code == 403:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message="Not authorized to create catalog items",
                 data=None
             )
         else:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message=f"Failed to create catalog item: {e.response.text}",
                 data=None
@@ -465,7 +762,7 @@ async def create_catalog_item(
             
     except (httpx.TimeoutException, httpx.NetworkError) as e:
         logger.error("Network error creating catalog item: %s", str(e))
-        return CatalogResponse(
+        return CatalogResponse.model_construct(
             success=False,
             message=f"Network error while creating catalog item: {str(e)}",
             data=None
@@ -473,7 +770,7 @@ async def create_catalog_item(
         
     except Exception as e:
         logger.exception("Unexpected error creating catalog item")
-        return CatalogResponse(
+        return CatalogResponse.model_construct(
             success=False,
             message=f"Unexpected error while creating catalog item: {str(e)}",
             data=None
@@ -511,7 +808,7 @@ async def update_catalog_item(
             payload["active"] = params.active
             
         if not payload:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message="No update parameters provided",
                 data=None
@@ -521,52 +818,54 @@ async def update_catalog_item(
         headers = await _get_auth_headers(auth_manager)
         
         # Make the API request
-        async with httpx.AsyncClient(timeout=config.timeout) as client:
-            response = await _maybe_await(client.patch,
-                f"{config.instance_url}/api/now/v1/servicecatalog/items/{params.item_id}",
-                json=payload,
-                headers=headers
-            )
-            await _maybe_await(response.raise_for_status)
-            
-            data = await _maybe_await(response.json)
-            item = data.get("result")
-            
-            if not item:
-                return CatalogResponse(
-                    success=False,
-                    message="Failed to update catalog item - no response data",
-                    data=None
-                )
-                
-            return CatalogResponse(
-                success=True,
-                message=f"Successfully updated catalog item: {params.item_id}",
-                data={"item": item}
+        client = _get_client(config)
+        response = await _maybe_await(client.patch,
+            f"{config.instance_url}/api/now/v1/servicecatalog/items/{params.item_id}",
+            json=payload,
+            headers=headers
+        )
+        await _maybe_await(response.raise_for_status)
+        
+        data = await _json_body(response)
+        item = data.get("result")
+        
+        if not item:
+            return CatalogResponse.model_construct(
+                success=False,
+                message="Failed to update catalog item - no response data",
+                data=None
             )
             
+        _invalidate_catalog_cache()
+        return CatalogResponse.model_construct(
+            success=True,
+            message=f"Successfully updated catalog item: {params.item_id}",
+            data={"item": item}
+        )
+        
     except httpx.HTTPStatusError as e:
         logger.error("HTTP error updating catalog item: %s", str(e))
         if e.response.status_code == 401:
-            return CatalogResponse(
+            _drop_auth_headers(auth_manager)
+            return CatalogResponse.model_construct(
                 success=False,
                 message="Authentication failed",
                 data=None
             )
         elif e.response.status_code == 403:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message="Not authorized to update this catalog item",
                 data=None
             )
         elif e.response.status_code == 404:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message=f"Catalog item {params.item_id} not found",
                 data=None
             )
         else:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message=f"Failed to update catalog item: {e.response.text}",
                 data=None
@@ -574,7 +873,7 @@ async def update_catalog_item(
             
     except (httpx.TimeoutException, httpx.NetworkError) as e:
         logger.error("Network error updating catalog item: %s", str(e))
-        return CatalogResponse(
+        return CatalogResponse.model_construct(
             success=False,
             message=f"Network error while updating catalog item: {str(e)}",
             data=None
@@ -582,7 +881,7 @@ async def update_catalog_item(
         
     except Exception as e:
         logger.exception("Unexpected error updating catalog item")
-        return CatalogResponse(
+        return CatalogResponse.model_construct(
             success=False,
             message=f"Unexpected error while updating catalog item: {str(e)}",
             data=None
@@ -606,7 +905,11 @@ async def list_catalog_categories(
         Dictionary containing catalog categories and metadata
     """
     logger.info("Listing service catalog categories with params: %s", params)
-    
+    cache_key = _catalog_cache_key(config, auth_manager, "list_catalog_categories", params)
+    cached = _cache_get(cache_key)
+    if cached is not None:
+        return cached
+
     try:
         # Build query parameters
         query_params = {
@@ -628,27 +931,30 @@ async def list_catalog_categories(
         headers = await _get_auth_headers(auth_manager)
         
         # Make the API request
-        async with httpx.AsyncClient(timeout=config.timeout) as client:
-            response = await _maybe_await(client.get,
-                f"{config.instance_url}/api/now/v1/servicecatalog/categories",
-                params=query_params,
-                headers=headers
-            )
-            await _maybe_await(response.raise_for_status)
-            
-            data = await _maybe_await(response.json)
-            result = data.get("result", [])
-            
-            return {
-                "categories": result,
-                "count": len(result),
-                "total": int(response.headers.get("X-Total-Count", "0")),
-                "hasMore": len(result) >= params.limit if params.limit > 0 else False
-            }
-            
+        client = _get_client(config)
+        response = await _maybe_await(client.get,
+            f"{config.instance_url}/api/now/v1/servicecatalog/categories",
+            params=query_params,
+            headers=headers
+        )
+        await _maybe_await(response.raise_for_status)
+        
+        data = await _json_body(response)
+        result = data.get("result", [])
+        
+        response_data = {
+            "categories": result,
+            "count": len(result),
+            "total": int(response.headers.get("X-Total-Count", "0")),
+            "hasMore": len(result) >= params.limit if params.limit > 0 else False
+        }
+        _cache_put(cache_key, response_data, response.headers)
+        return response_data
+        
     except httpx.HTTPStatusError as e:
         logger.error("HTTP error listing catalog categories: %s", str(e))
         if e.response.status_code == 401:
+            _drop_auth_headers(auth_manager)
             raise ValueError("Authentication failed")
         elif e.response.status_code == 403:
             raise ValueError("Not authorized to list catalog categories")
@@ -696,46 +1002,48 @@ async def create_catalog_category(
         headers = await _get_auth_headers(auth_manager)
         
         # Make the API request
-        async with httpx.AsyncClient(timeout=config.timeout) as client:
-            response = await _maybe_await(client.post,
-                f"{config.instance_url}/api/now/v1/servicecatalog/categories",
-                json=payload,
-                headers=headers
-            )
-            await _maybe_await(response.raise_for_status)
-            
-            data = await _maybe_await(response.json)
-            category = data.get("result")
-            
-            if not category:
-                return CatalogResponse(
-                    success=False,
-                    message="Failed to create catalog category - no response data",
-                    data=None
-                )
-                
-            return CatalogResponse(
-                success=True,
-                message=f"Successfully created catalog category: {category.get('sys_id')}",
-                data={"category": category}
+        client = _get_client(config)
+        response = await _maybe_await(client.post,
+            f"{config.instance_url}/api/now/v1/servicecatalog/categories",
+            json=payload,
+            headers=headers
+        )
+        await _maybe_await(response.raise_for_status)
+        
+        data = await _json_body(response)
+        category = data.get("result")
+        
+        if not category:
+            return CatalogResponse.model_construct(
+                success=False,
+                message="Failed to create catalog category - no response data",
+                data=None
             )
             
+        _invalidate_catalog_cache()
+        return CatalogResponse.model_construct(
+            success=True,
+            message=f"Successfully created catalog category: {category.get('sys_id')}",
+            data={"category": category}
+        )
+        
     except httpx.HTTPStatusError as e:
         logger.error("HTTP error creating catalog category: %s", str(e))
         if e.response.status_code == 401:
-            return CatalogResponse(
+            _drop_auth_headers(auth_manager)
+            return CatalogResponse.model_construct(
                 success=False,
                 message="Authentication failed",
                 data=None
             )
         elif e.response.status_code == 403:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message="Not authorized to create catalog categories",
                 data=None
             )
         else:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message=f"Failed to create catalog category: {e.response.text}",
                 data=None
@@ -743,7 +1051,7 @@ async def create_catalog_category(
             
     except (httpx.TimeoutException, httpx.NetworkError) as e:
         logger.error("Network error creating catalog category: %s", str(e))
-        return CatalogResponse(
+        return CatalogResponse.model_construct(
             success=False,
             message=f"Network error while creating catalog category: {str(e)}",
             data=None
@@ -751,7 +1059,7 @@ async def create_catalog_category(
         
     except Exception as e:
         logger.exception("Unexpected error creating catalog category")
-        return CatalogResponse(
+        return CatalogResponse.model_construct(
             success=False,
             message=f"Unexpected error while creating catalog category: {str(e)}",
             data=None
@@ -787,7 +1095,7 @@ async def update_catalog_category(
             payload["parent_category"] = params.parent_category
             
         if not payload:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message="No update parameters provided",
                 data=None
@@ -797,52 +1105,54 @@ async def update_catalog_category(
         headers = await _get_auth_headers(auth_manager)
         
         # Make the API request
-        async with httpx.AsyncClient(timeout=config.timeout) as client:
-            response = await _maybe_await(client.patch,
-                f"{config.instance_url}/api/now/v1/servicecatalog/categories/{params.category_id}",
-                json=payload,
-                headers=headers
-            )
-            await _maybe_await(response.raise_for_status)
-            
-            data = await _maybe_await(response.json)
-            category = data.get("result")
-            
-            if not category:
-                return CatalogResponse(
-                    success=False,
-                    message="Failed to update catalog category - no response data",
-                    data=None
-                )
-                
-            return CatalogResponse(
-                success=True,
-                message=f"Successfully updated catalog category: {params.category_id}",
-                data={"category": category}
+        client = _get_client(config)
+        response = await _maybe_await(client.patch,
+            f"{config.instance_url}/api/now/v1/servicecatalog/categories/{params.category_id}",
+            json=payload,
+            headers=headers
+        )
+        await _maybe_await(response.raise_for_status)
+        
+        data = await _json_body(response)
+        category = data.get("result")
+        
+        if not category:
+            return CatalogResponse.model_construct(
+                success=False,
+                message="Failed to update catalog category - no response data",
+                data=None
             )
             
+        _invalidate_catalog_cache()
+        return CatalogResponse.model_construct(
+            success=True,
+            message=f"Successfully updated catalog category: {params.category_id}",
+            data={"category": category}
+        )
+        
     except httpx.HTTPStatusError as e:
         logger.error("HTTP error updating catalog category: %s", str(e))
         if e.response.status_code == 401:
-            return CatalogResponse(
+            _drop_auth_headers(auth_manager)
+            return CatalogResponse.model_construct(
                 success=False,
                 message="Authentication failed",
                 data=None
             )
         elif e.response.status_code == 403:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message="Not authorized to update this catalog category",
                 data=None
             )
         elif e.response.status_code == 404:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message=f"Catalog category {params.category_id} not found",
                 data=None
             )
         else:
-            return CatalogResponse(
+            return CatalogResponse.model_construct(
                 success=False,
                 message=f"Failed to update catalog category: {e.response.text}",
                 data=None
@@ -850,7 +1160,7 @@ async def update_catalog_category(
             
     except (httpx.TimeoutException, httpx.NetworkError) as e:
         logger.error("Network error updating catalog category: %s", str(e))
-        return CatalogResponse(
+        return CatalogResponse.model_construct(
             success=False,
             message=f"Network error while updating catalog category: {str(e)}",
             data=None
@@ -858,7 +1168,7 @@ async def update_catalog_category(
         
     except Exception as e:
         logger.exception("Unexpected error updating catalog category")
-        return CatalogResponse(
+        return CatalogResponse.model_construct(
             success=False,
             message=f"Unexpected error while updating catalog category: {str(e)}",
             data=None
@@ -875,35 +1185,49 @@ TOOL_DESCRIPTION = "ServiceNow tools for service catalog and category management
 OPERATIONS = {
     "list_catalog_items": {
         "description": "List service catalog items",
+        "params_model": ListCatalogItemsParams,
+        "params_arg_name": "params",
         "required_params": [],
         "optional_params": ["limit", "offset", "category", "query", "active"],
     },
     "get_catalog_item": {
         "description": "Get catalog item details",
+        "params_model": GetCatalogItemParams,
+        "params_arg_name": "params",
         "required_params": ["item_id"],
     },
     "create_catalog_item": {
         "description": "Create a new catalog item",
+        "params_model": CreateCatalogItemParams,
+        "params_arg_name": "params",
         "required_params": ["name", "description"],
         "optional_params": ["category", "template", "workflow", "active"],
     },
     "update_catalog_item": {
         "description": "Update an existing catalog item",
+        "params_model": UpdateCatalogItemParams,
+        "params_arg_name": "params",
         "required_params": ["item_id"],
         "optional_params": ["name", "description", "category", "active"],
     },
     "list_catalog_categories": {
         "description": "List service catalog categories",
+        "params_model": ListCatalogCategoriesParams,
+        "params_arg_name": "params",
         "required_params": [],
         "optional_params": ["limit", "offset", "query", "active"],
     },
     "create_catalog_category": {
         "description": "Create a new catalog category",
+        "params_model": CreateCatalogCategoryParams,
+        "params_arg_name": "params",
         "required_params": ["name", "description"],
         "optional_params": ["parent_category"],
     },
     "update_catalog_category": {
         "description": "Update an existing catalog category",
+        "params_model": UpdateCatalogCategoryParams,
+        "params_arg_name": "params",
         "required_params": ["category_id"],
         "optional_params": ["name", "description", "parent_category"],
     },
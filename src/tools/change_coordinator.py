@@ -306,30 +306,42 @@ TOOL_DESCRIPTION = "ServiceNow tools for change management and approval workflow
 OPERATIONS = {
     "list_change_requests": {
         "description": "List change requests matching query parameters",
+        "params_model": ListChangeRequestsParams,
+        "params_arg_name": "params",
         "required_params": [],
         "optional_params": ["query", "state", "type", "assignment_group", "limit", "offset"]
     },
     "get_change_request": {
         "description": "Get detailed information about a change request",
+        "params_model": GetChangeRequestParams,
+        "params_arg_name": "params",
         "required_params": ["change_number"]
     },
     "create_change_request": {
         "description": "Create a new change request",
+        "params_model": CreateChangeRequestParams,
+        "params_arg_name": "params",
         "required_params": ["short_description"],
         "optional_params": ["type", "risk", "impact", "assignment_group", "start_date", "end_date"]
     },
     "update_change_request": {
         "description": "Update an existing change request",
+        "params_model": UpdateChangeRequestParams,
+        "params_arg_name": "params",
         "required_params": ["change_number"],
         "optional_params": ["short_description", "type", "risk", "impact", "state"]
     },
     "approve_change": {
         "description": "Approve a change request",
+        "params_model": ApproveChangeParams,
+        "params_arg_name": "params",
         "required_params": ["change_number"],
         "optional_params": ["comments"]
     },
     "reject_change": {
         "description": "Reject a change request",
+        "params_model": RejectChangeParams,
+        "params_arg_name": "params",
         "required_params": ["change_number", "reason"]
     }
 }
@@ -100,16 +100,22 @@ TOOL_DESCRIPTION = "Read-only CMDB access: CIs and relationships"
 OPERATIONS = {
     "list_cis": {
         "description": "List configuration items (read-only)",
+        "params_model": ListCIsParams,
+        "params_arg_name": "params",
         "required_params": [],
         "optional_params": ["limit", "offset", "query", "class_name"],
     },
     "get_ci": {
         "description": "Get CI by sys_id",
+        "params_model": GetCIParams,
+        "params_arg_name": "params",
         "required_params": ["sys_id"],
         "optional_params": ["class_name"],
     },
     "list_ci_relationships": {
         "description": "List relationships for a CI",
+        "params_model": ListCIRelationshipsParams,
+        "params_arg_name": "params",
         "required_params": ["sys_id"],
         "optional_params": ["direction"],
     },
@@ -241,20 +241,28 @@ TOOL_DESCRIPTION = "ServiceNow tools for knowledge base article management"
 OPERATIONS = {
     "list_articles": {
         "description": "List knowledge articles matching query parameters",
+        "params_model": ListArticlesParams,
+        "params_arg_name": "params",
         "required_params": [],
         "optional_params": ["query", "kb_category", "workflow_state", "limit", "offset"]
     },
     "get_article": {
         "description": "Get a specific knowledge article",
+        "params_model": GetArticleParams,
+        "params_arg_name": "params",
         "required_params": ["article_id"]
     },
     "create_article": {
         "description": "Create a new knowledge article",
+        "params_model": CreateArticleParams,
+        "params_arg_name": "params",
         "required_params": ["title", "content"],
         "optional_params": ["kb_category", "keywords", "roles", "workflow_state"]
     },
     "update_article": {
         "description": "Update an existing knowledge article",
+        "params_model": UpdateArticleParams,
+        "params_arg_name": "params",
         "required_params": ["article_id"],
         "optional_params": ["title", "content", "kb_category", "keywords", "workflow_state"]
     }
@@ -3,7 +3,7 @@ Service Desk tools for ServiceNow MCP integration.
 Handles incident management and user lookup operations.
 """
 import logging
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, List, Optional
 
 import httpx
 import inspect
@@ -227,6 +227,38 @@ async def list_incidents(
         raise ValueError(f"Unexpected error while listing incidents: {str(e)}")
 
 
+# Page size used when streaming list results
+_STREAM_PAGE_SIZE = 100
+
+
+async def list_incidents_stream(
+    config: ServerConfig,
+    auth_manager: AuthManager,
+    params: ListIncidentsParams,
+) -> AsyncIterator[Dict[str, Any]]:
+    """
+    Stream incidents from ServiceNow one page at a time.
+
+    Args:
+        config: Server configuration
+        auth_manager: Authentication manager
+        params: Parameters for listing incidents; limit caps the total streamed
+
+    Yields:
+        list_incidents results, one per page
+    """
+    remaining = params.limit
+    offset = params.offset
+    while remaining > 0:
+        page_params = params.model_copy(update={"limit": min(remaining, _STREAM_PAGE_SIZE), "offset": offset})
+        page = await list_incidents(config, auth_manager, page_params)
+        yield page
+        if not page["hasMore"]:
+            break
+        remaining -= page["count"]
+        offset += page["count"]
+
+
 @retry(
     stop=stop_after_attempt(3),
     wait=wait_exponential(multiplier=1, min=4, max=10),
@@ -560,43 +592,61 @@ TOOL_DESCRIPTION = "ServiceNow tools for incident management and user operations
 OPERATIONS = {
     "list_incidents": {
         "description": "List incidents matching query parameters",
+        "params_model": ListIncidentsParams,
+        "params_arg_name": "params",
         "required_params": [],
         "optional_params": ["query", "limit", "offset", "state"]
     },
     "get_incident": {
         "description": "Get incident details",
+        "params_model": GetIncidentParams,
+        "params_arg_name": "params",
         "required_params": ["incident_number"]
     },
     "create_incident": {
         "description": "Create a new incident in ServiceNow",
+        "params_model": CreateIncidentParams,
+        "params_arg_name": "params",
         "required_params": ["description"],
         "optional_params": ["urgency", "impact", "priority", "assignment_group"]
     },
     "update_incident": {
         "description": "Update an existing incident",
+        "params_model": UpdateIncidentParams,
+        "params_arg_name": "params",
         "required_params": ["incident_number"],
         "optional_params": ["description", "urgency", "impact", "priority", "state"]
     },
     "add_comment": {
         "description": "Add a comment to an incident",
+        "params_model": AddCommentParams,
+        "params_arg_name": "params",
         "required_params": ["incident_number", "comment"]
     },
     "resolve_incident": {
         "description": "Resolve an incident",
+        "params_model": ResolveIncidentParams,
+        "params_arg_name": "params",
         "required_params": ["incident_number", "resolution_notes"]
     },
     "list_my_incidents": {
         "description": "List incidents for a specific user (caller)",
+        "params_model": ListMyIncidentsParams,
+        "params_arg_name": "params",
         "required_params": [],
         "optional_params": ["user_id", "user_name", "limit", "offset", "state"]
     },
     "list_users": {
         "description": "List users matching query parameters",
+        "params_model": ListUsersParams,
+        "params_arg_name": "params",
         "required_params": [],
         "optional_params": ["query", "limit", "offset"]
     },
     "get_user": {
         "description": "Get user details",
+        "params_model": GetUserParams,
+        "params_arg_name": "params",
         "required_params": ["user_id"]
     }
 }
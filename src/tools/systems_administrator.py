@@ -361,35 +361,49 @@ TOOL_DESCRIPTION = "ServiceNow tools for user and group administration"
 OPERATIONS = {
     "list_users": {
         "description": "List users matching query parameters",
+        "params_model": ListUsersParams,
+        "params_arg_name": "params",
         "required_params": [],
         "optional_params": ["query", "roles", "department", "active", "limit", "offset"]
     },
     "get_user": {
         "description": "Get user details",
+        "params_model": GetUserParams,
+        "params_arg_name": "params",
         "required_params": ["user_id"]
     },
     "create_user": {
         "description": "Create a new user",
+        "params_model": CreateUserParams,
+        "params_arg_name": "params",
         "required_params": ["username", "email"],
         "optional_params": ["first_name", "last_name", "roles", "department", "title"]
     },
     "update_user": {
         "description": "Update an existing user",
+        "params_model": UpdateUserParams,
+        "params_arg_name": "params",
         "required_params": ["user_id"],
         "optional_params": ["email", "first_name", "last_name", "roles", "active", "locked"]
     },
     "list_groups": {
         "description": "List groups matching query parameters",
+        "params_model": ListGroupsParams,
+        "params_arg_name": "params",
         "required_params": [],
         "optional_params": ["query", "type", "active", "limit", "offset"]
     },
     "create_group": {
         "description": "Create a new group",
+        "params_model": CreateGroupParams,
+        "params_arg_name": "params",
         "required_params": ["name"],
         "optional_params": ["description", "parent_group", "roles", "type"]
     },
     "update_group": {
         "description": "Update an existing group",
+        "params_model": UpdateGroupParams,
+        "params_arg_name": "params",
         "required_params": ["group_id"],
         "optional_params": ["name", "description", "parent_group", "roles", "active"]
     }
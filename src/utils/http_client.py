@@ -1,15 +1,23 @@
 """HTTP client utilities for ServiceNow API interactions."""
 import asyncio
+import itertools
 import logging
 import time
 from typing import Any, Dict, Optional, AsyncIterator
 from datetime import datetime, timedelta
 
 import httpx
+import orjson
 from config import ServerConfig
 from auth.auth_manager import AuthManager
 
 logger = logging.getLogger(__name__)
+_request_logger = logging.getLogger(__name__ + ".request")
+# Per-process sequence for log correlation ids; unlike a millisecond
+# timestamp it never repeats for concurrent requests
+_request_ids = itertools.count(1)
+# Encoded-query operators stripped by sanitize_query_param
+_QUERY_STRIP = str.maketrans("", "", "^=")
 
 class RateLimiter:
     """Rate limiter for API requests."""
@@ -19,7 +27,7 @@ class RateLimiter:
         self._cleanup_threshold = 1000  # Cleanup history when this many requests accumulate
         self.logger = logging.getLogger(__name__ + ".RateLimiter")
         self.logger.info(
-            f"Initialized rate limiter with {requests_per_minute} requests per minute"
+            "Initialized rate limiter with %d requests per minute", requests_per_minute
         )
 
     async def acquire(self):
@@ -32,8 +40,8 @@ class RateLimiter:
         recent_requests = len([r for r in self.requests if r > minute_ago])
         
         self.logger.debug(
-            f"Rate limit check: {recent_requests}/{self.requests_per_minute} "
-            f"requests in last minute"
+            "Rate limit check: %d/%d requests in last minute",
+            recent_requests, self.requests_per_minute,
         )
         
         if recent_requests >= self.requests_per_minute:
@@ -42,8 +50,8 @@ class RateLimiter:
             delay = (oldest_recent + timedelta(minutes=1) - now).total_seconds()
             if delay > 0:
                 self.logger.warning(
-                    f"Rate limit reached ({recent_requests} requests in last minute). "
-                    f"Waiting {delay:.2f} seconds"
+                    "Rate limit reached (%d requests in last minute). Waiting %.2f seconds",
+                    recent_requests, delay,
                 )
                 await asyncio.sleep(delay)
         
@@ -74,10 +82,12 @@ def get_secure_client(timeout: int) -> httpx.AsyncClient:
         "SSL verification=True, HTTP/2=True"
     )
     
+    # ServiceNowClient keeps this client for the process lifetime, so let idle
+    # connections outlive typical gaps between calls instead of re-handshaking
     limits = httpx.Limits(
         max_keepalive_connections=5,
         max_connections=10,
-        keepalive_expiry=5.0
+        keepalive_expiry=120.0
     )
     
     client_logger.debug(
@@ -159,7 +169,7 @@ def sanitize_query_param(value: str, max_length: int = 100) -> str:
         Sanitized value
     """
     # Remove potential injection characters
-    safe_value = value.replace('^', '').replace('=', '')
+    safe_value = value.translate(_QUERY_STRIP)
     # Limit length
     return safe_value[:max_length]
 
@@ -214,30 +224,35 @@ async def make_request(
         httpx.NetworkError: For network-related errors
         ValueError: For validation errors
     """
-    request_id = f"{method}_{int(time.time() * 1000)}"
-    request_logger = logging.getLogger(__name__ + f".request.{request_id}")
-    
+    request_id = f"{method}_{next(_request_ids):x}"
+    # One shared logger: a getLogger() per request id would be registered
+    # with the logging manager forever
+    request_logger = _request_logger
+    debug = request_logger.isEnabledFor(logging.DEBUG)
+
     request_logger.info(
-        f"Initiating {method} request to {url}\n"
-        f"Configuration:\n"
-        f"- Timeout: {config.timeout}s\n"
-        f"- Max retries: {max_retries}\n"
-        f"- Rate limit: {config.rate_limit} requests/minute"
+        "[%s] Initiating %s request to %s\n"
+        "Configuration:\n"
+        "- Timeout: %ss\n"
+        "- Max retries: %s\n"
+        "- Rate limit: %s requests/minute",
+        request_id, method, url, config.timeout, max_retries, config.rate_limit,
     )
-    
-    if params:
-        request_logger.debug(f"Query parameters: {params}")
-    if json_data:
-        request_logger.debug(f"Request body: {json_data}")
-    
+
+    if debug and params:
+        request_logger.debug("[%s] Query parameters: %s", request_id, params)
+    if debug and json_data:
+        request_logger.debug("[%s] Request body: %s", request_id, json_data)
+
     headers = get_secure_headers(await auth_manager.aget_headers())
-    request_logger.debug(f"Request headers: {headers}")
+    if debug:
+        request_logger.debug("[%s] Request headers: %s", request_id, headers)
     
     rate_limiter = RateLimiter(requests_per_minute=config.rate_limit or 100)
     retry_count = 0
     last_error = None
     
-    request_logger.info("Starting request execution")
+    request_logger.info("[%s] Starting request execution", request_id)
     
     while retry_count < max_retries:
         try:
@@ -245,14 +260,15 @@ async def make_request(
             await rate_limiter.acquire()
             
             # Log request details at debug level
-            logger.debug(f"Making {method} request to {url}")
-            logger.debug(f"Params: {params}")
-            logger.debug(f"Headers: {headers}")
-            if json_data:
-                logger.debug(f"Request body: {json_data}")
-            
+            if debug:
+                logger.debug("Making %s request to %s", method, url)
+                logger.debug("Params: %s", params)
+                logger.debug("Headers: %s", headers)
+                if json_data:
+                    logger.debug("Request body: %s", json_data)
+
             async with get_secure_client(config.timeout) as client:
-                start_time = time.time()
+                start_time = time.perf_counter()
                 response = await client.request(
                     method=method,
                     url=url,
@@ -260,10 +276,10 @@ async def make_request(
                     json=json_data,
                     headers=headers
                 )
-                duration = time.time() - start_time
-                
+                duration = time.perf_counter() - start_time
+
                 # Log response timing
-                logger.info(f"{method} {url} completed in {duration:.2f}s with status {response.status_code}")
+                logger.info("%s %s completed in %.2fs with status %s", method, url, duration, response.status_code)
                 
                 try:
                     response.raise_for_status()
@@ -278,7 +294,7 @@ async def make_request(
                     elif e.response.status_code == 429:
                         # Rate limit hit - wait and retry
                         retry_after = int(e.response.headers.get('Retry-After', '60'))
-                        logger.warning(f"Rate limit hit, waiting {retry_after}s before retry")
+                        logger.warning("Rate limit hit, waiting %ss before retry", retry_after)
                         await asyncio.sleep(retry_after)
                         retry_count += 1
                         continue
@@ -286,7 +302,7 @@ async def make_request(
                         # Server errors - retry with backoff
                         if retry_count < max_retries - 1:
                             wait_time = 2 ** retry_count
-                            logger.warning(f"Server error, retrying in {wait_time}s")
+                            logger.warning("Server error, retrying in %ss", wait_time)
                             await asyncio.sleep(wait_time)
                             retry_count += 1
                             continue
@@ -296,19 +312,20 @@ async def make_request(
                 
                 # Parse response
                 try:
-                    data = await response.json()
-                    logger.debug(f"Response data: {data}")
+                    # orjson parses the body bytes directly; JSONDecodeError is a ValueError
+                    data = orjson.loads(response.content)
+                    logger.debug("Response data: %s", data)
                     return data
                 except ValueError as e:
-                    logger.error(f"Failed to parse JSON response: {str(e)}")
+                    logger.error("Failed to parse JSON response: %s", e)
                     raise ValueError(f"Invalid JSON response: {str(e)}")
                 
         except httpx.TransportError as e:
-            logger.error(f"Network error occurred: {str(e)}")
+            logger.error("Network error occurred: %s", e)
             last_error = e
             if retry_count < max_retries - 1:
                 wait_time = 2 ** retry_count
-                logger.warning(f"Network error, retrying in {wait_time}s")
+                logger.warning("Network error, retrying in %ss", wait_time)
                 await asyncio.sleep(wait_time)
                 retry_count += 1
                 continue
@@ -351,7 +368,7 @@ async def stream_request(
         is True.
     """
     headers = get_secure_headers(await auth_manager.aget_headers())
-    logger.info(f"Starting streaming {method} request to {url}")
+    logger.info("Starting streaming %s request to %s", method, url)
 
     rate_limiter = RateLimiter(requests_per_minute=config.rate_limit or 100)
     await rate_limiter.acquire()
@@ -366,10 +383,11 @@ async def stream_request(
         ) as response:
             # Raise if not 2xx before streaming
             response.raise_for_status()
-            logger.debug(
-                f"Streaming response headers: status={response.status_code}, "
-                f"headers={dict(response.headers)}"
-            )
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Streaming response headers: status=%s, headers=%s",
+                    response.status_code, dict(response.headers),
+                )
 
             if as_lines:
                 async for line in response.aiter_lines():
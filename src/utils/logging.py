@@ -1,7 +1,10 @@
 """Logging configuration and utilities."""
+import atexit
+import copy
 import logging
 import logging.handlers
 import os
+import queue
 import sys
 import json
 from datetime import datetime
@@ -22,6 +25,32 @@ class JsonFormatter(logging.Formatter):
         return json.dumps(payload, ensure_ascii=False)
 
 
+class _DeferredQueueHandler(logging.handlers.QueueHandler):
+    """Queue records without formatting them.
+
+    The stock QueueHandler formats the record (traceback included) in the
+    logging thread; here only the message is merged, and the listener
+    thread's handlers do the rest.
+    """
+
+    def prepare(self, record: logging.LogRecord) -> logging.LogRecord:
+        record = copy.copy(record)
+        # Resolve args now, while they still hold the values being logged
+        record.msg = record.getMessage()
+        record.args = None
+        return record
+
+
+_listener: Optional[logging.handlers.QueueListener] = None
+
+
+def _stop_listener() -> None:
+    global _listener
+    if _listener is not None:
+        listener, _listener = _listener, None
+        listener.stop()
+
+
 def setup_logging(
     log_level: str = "INFO",
     log_file: Optional[str] = None,
@@ -56,13 +85,14 @@ def setup_logging(
     root_logger = logging.getLogger()
     root_logger.setLevel(log_level.upper())
     
-    # Remove any existing handlers
+    # Remove any existing handlers (and the listener feeding them)
+    _stop_listener()
     root_logger.handlers = []
     
     # Always add console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(formatter)
-    root_logger.addHandler(console_handler)
+    handlers = [console_handler]
     
     # Add file handler if log file specified
     if log_file:
@@ -76,13 +106,48 @@ def setup_logging(
             backupCount=backup_count
         )
         file_handler.setFormatter(formatter)
-        root_logger.addHandler(file_handler)
+        handlers.append(file_handler)
+
+    # Formatting and I/O happen on the listener's thread, so a burst of
+    # logger.exception() calls doesn't block the event loop
+    global _listener
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    root_logger.addHandler(_DeferredQueueHandler(log_queue))
+    _listener = logging.handlers.QueueListener(log_queue, *handlers, respect_handler_level=True)
+    _listener.start()
     
     # Create module loggers with appropriate levels
     logging.getLogger("uvicorn").setLevel(logging.INFO)
     logging.getLogger("fastapi").setLevel(logging.INFO)
     logging.getLogger("httpx").setLevel(logging.INFO)
 
+atexit.register(_stop_listener)
+
+
+def _restart_listener_after_fork() -> None:
+    """Give a forked child (e.g. a Gunicorn --preload worker) its own listener.
+
+    Threads don't survive fork, so the inherited listener is dead. Its queue
+    is replaced too: records still in it are the parent's, and its lock may
+    have been held by the listener thread at the moment of the fork.
+    """
+    global _listener
+    if _listener is None:
+        return
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    for handler in logging.getLogger().handlers:
+        if isinstance(handler, _DeferredQueueHandler):
+            handler.queue = log_queue
+    _listener = logging.handlers.QueueListener(
+        log_queue, *_listener.handlers, respect_handler_level=True
+    )
+    _listener.start()
+
+
+if hasattr(os, "register_at_fork"):
+    os.register_at_fork(after_in_child=_restart_listener_after_fork)
+
+
 def get_logger(name: str) -> logging.Logger:
     """Get a logger with the specified name.
     
@@ -5,11 +5,13 @@ Provides async get/post/put/delete methods that:
 - Attach auth + default headers via AuthManager
 - Use httpx.AsyncClient with secure defaults
 - Raise for HTTP errors so callers can handle via existing try/except
+- Revalidate repeated GETs with ETag/Last-Modified conditional requests
 """
 from __future__ import annotations
 
 import logging
-from typing import Any, Dict, Optional
+from collections import OrderedDict
+from typing import Any, Dict, Optional, Tuple
 
 import httpx
 
@@ -20,6 +22,13 @@ from .http_client import get_secure_client, get_secure_headers
 
 logger = logging.getLogger(__name__)
 
+# Validated GET responses kept per client for conditional requests:
+# {url: (etag, last_modified, response headers, body)}
+_VALIDATED_CACHE_SIZE = 256
+# Larger bodies are always downloaded again rather than held in memory
+_VALIDATED_MAX_BODY = 1024 * 1024
+_WIRE_HEADERS = ("content-encoding", "content-length", "transfer-encoding")
+
 
 def _secure_headers(base: Dict[str, str]) -> Dict[str, str]:
     headers = {
@@ -34,10 +43,22 @@ class ServiceNowClient:
     def __init__(self, config: ServerConfig, auth_manager: AuthManager):
         self.config = config
         self.auth_manager = auth_manager
+        # One pooled client for every call, so connections (and their TLS
+        # sessions) are reused; created on first request
+        self._http: Optional[httpx.AsyncClient] = None
+        self._validated: "OrderedDict[str, Tuple[Optional[str], Optional[str], httpx.Headers, bytes]]" = OrderedDict()
 
     async def _client(self) -> httpx.AsyncClient:
-        # Reuse shared secure client configuration
-        return get_secure_client(self.config.timeout)
+        """Return the shared client, creating it with the secure defaults on first use."""
+        if self._http is None:
+            self._http = get_secure_client(self.config.timeout)
+        return self._http
+
+    async def aclose(self) -> None:
+        """Close the shared client, if one was created."""
+        if self._http is not None:
+            client, self._http = self._http, None
+            await client.aclose()
 
     async def _request(
         self,
@@ -54,17 +75,54 @@ class ServiceNowClient:
         if headers:
             all_headers.update(headers)
 
-        async with await self._client() as client:
-            resp = await client.request(
-                method=method,
-                url=url,
-                params=params,
-                json=json,
-                headers=all_headers,
-            )
-            # Raise for non-2xx so tool-level error handling kicks in
-            resp.raise_for_status()
-            return resp
+        client = await self._client()
+        request = client.build_request(
+            method=method,
+            url=url,
+            params=params,
+            json=json,
+            headers=all_headers,
+        )
+        if method == "GET":
+            return await self._conditional_get(client, request)
+        resp = await client.send(request)
+        # Raise for non-2xx so tool-level error handling kicks in
+        resp.raise_for_status()
+        return resp
+
+    async def _conditional_get(self, client: httpx.AsyncClient, request: httpx.Request) -> httpx.Response:
+        """Send a GET, revalidating a stored copy so an unchanged resource comes back as a bodiless 304."""
+        key = str(request.url)
+        cached = self._validated.get(key)
+        if cached is not None:
+            etag, last_modified, _, _ = cached
+            if etag:
+                request.headers.setdefault("If-None-Match", etag)
+            if last_modified:
+                request.headers.setdefault("If-Modified-Since", last_modified)
+
+        resp = await client.send(request)
+        if resp.status_code == 304 and cached is not None:
+            self._validated.move_to_end(key)
+            # Callers see the stored response as if it had been sent again
+            return httpx.Response(200, headers=cached[2], content=cached[3], request=request)
+        # Raise for non-2xx so tool-level error handling kicks in
+        resp.raise_for_status()
+
+        etag = resp.headers.get("etag")
+        last_modified = resp.headers.get("last-modified")
+        if (etag or last_modified) and len(resp.content) <= _VALIDATED_MAX_BODY:
+            # The stored body is already decoded, so drop the headers describing the wire form
+            headers = resp.headers.copy()
+            for name in _WIRE_HEADERS:
+                headers.pop(name, None)
+            self._validated[key] = (etag, last_modified, headers, resp.content)
+            self._validated.move_to_end(key)
+            if len(self._validated) > _VALIDATED_CACHE_SIZE:
+                self._validated.popitem(last=False)
+        else:
+            self._validated.pop(key, None)
+        return resp
 
     # Public HTTP helpers used by tool functions
     async def get(self, url: str, *, params: Optional[Dict[str, Any]] = None, headers: Optional[Dict[str, str]] = None):
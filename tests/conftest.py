@@ -13,7 +13,14 @@ src_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), "..", "src"))
 tests_dir = os.path.abspath(os.path.dirname(__file__))
 sys.path.extend([src_dir, tests_dir])
 
-from config import ServerConfig, AuthConfig, AuthType, BasicAuthConfig
+from config import ServerConfig, AuthConfig, AuthType, BasicAuthConfig, reload_runtime_settings
+
+@pytest.fixture(autouse=True)
+def fresh_runtime_settings():
+    """Re-read env-derived runtime settings around each test."""
+    reload_runtime_settings()
+    yield
+    reload_runtime_settings()
 
 @pytest.fixture(scope="session")
 def test_config() -> ServerConfig:
@@ -55,7 +55,7 @@ async def test_basic_auth_flow():
     
     # Patch httpx.AsyncClient
     with patch('httpx.AsyncClient') as mock_async_client:
-        mock_async_client.return_value.__aenter__.return_value = mock_client
+        mock_async_client.return_value = mock_client
         
         # Create auth config
         config = AuthConfig.create_oauth_config(
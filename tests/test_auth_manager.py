@@ -37,10 +37,9 @@ def mock_httpx_client():
         mock_response.raise_for_status = Mock()
         mock_response.json.return_value = MOCK_TOKEN_RESPONSE
         
-        # Setup mock client
-        client_instance = Mock()
+        # Setup mock client (AuthManager reuses one client instance)
+        client_instance = mock_client.return_value
         client_instance.post.return_value = mock_response
-        mock_client.return_value.__aenter__.return_value = client_instance
         
         yield mock_client
 
@@ -75,7 +74,7 @@ async def test_token_refresh(auth_config, mock_httpx_client):
     # Mock new token response
     new_token = MOCK_TOKEN_RESPONSE.copy()
     new_token["access_token"] = "new_access_token"
-    mock_httpx_client.return_value.__aenter__.return_value.post.return_value.json.return_value = new_token
+    mock_httpx_client.return_value.post.return_value.json.return_value = new_token
     
     # Attempt refresh
     success = await auth_manager.refresh()
@@ -91,7 +90,7 @@ async def test_token_refresh(auth_config, mock_httpx_client):
 async def test_authentication_failure(auth_config, mock_httpx_client):
     """Test authentication failure handling"""
     # Setup mock to raise an error
-    mock_httpx_client.return_value.__aenter__.return_value.post.side_effect = httpx.HTTPError("Auth failed")
+    mock_httpx_client.return_value.post.side_effect = httpx.HTTPError("Auth failed")
     
     auth_manager = AuthManager(auth_config)
     success = await auth_manager.authenticate()
@@ -113,7 +112,7 @@ async def test_refresh_failure_fallback(auth_config, mock_httpx_client):
     original_token = auth_manager._token_info.access_token
     
     # Make refresh fail but new auth succeed
-    mock_response = mock_httpx_client.return_value.__aenter__.return_value.post
+    mock_response = mock_httpx_client.return_value.post
     mock_response.side_effect = [
         httpx.HTTPError("Refresh failed"),  # First call fails (refresh)
         Mock(
@@ -128,3 +127,29 @@ async def test_refresh_failure_fallback(auth_config, mock_httpx_client):
     assert success is True
     assert auth_manager._token_info is not None
     assert auth_manager._token_info.access_token != original_token
+
+@pytest.mark.asyncio
+async def test_token_client_reused(auth_config, mock_httpx_client):
+    """Test authenticate and refresh share a single HTTP client"""
+    auth_manager = AuthManager(auth_config)
+
+    await auth_manager.authenticate()
+    await auth_manager.refresh()
+
+    assert mock_httpx_client.call_count == 1
+    assert mock_httpx_client.return_value.post.call_count == 2
+
+@pytest.mark.asyncio
+async def test_valid_token_skips_token_request(auth_config, mock_httpx_client):
+    """Test a token inside its validity window is reused, and refreshed once stale"""
+    auth_manager = AuthManager(auth_config)
+    post = mock_httpx_client.return_value.post
+
+    await auth_manager.authenticate()
+    assert await auth_manager.authenticate() is True
+    assert post.call_count == 1
+
+    auth_manager._token_deadline = 1.0  # long past on the monotonic clock
+    assert await auth_manager.authenticate() is True
+    assert post.call_count == 2
+    assert post.call_args.kwargs["data"]["grant_type"] == "refresh_token"
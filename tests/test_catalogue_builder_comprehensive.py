@@ -1,8 +1,11 @@
 ﻿"""Comprehensive test suite for ServiceNow catalog management functionality."""
+import asyncio
+import gc
 import logging
 import os
 import sys
 import tracemalloc
+import weakref
 from unittest.mock import AsyncMock, MagicMock, patch
 
 import httpx
@@ -20,6 +23,7 @@ sys.path.insert(0, os.path.abspath(os.path.join(os.path.dirname(__file__), '..',
 from auth.auth_manager import AuthManager
 from config import ServerConfig, AuthConfig, AuthType, BasicAuthConfig
 
+from tools import catalogue_builder
 from tools.catalogue_builder import (
     ListCatalogItemsParams,
     GetCatalogItemParams,
@@ -29,6 +33,7 @@ from tools.catalogue_builder import (
     CreateCatalogCategoryParams,
     UpdateCatalogCategoryParams,
     list_catalog_items,
+    list_catalog_items_stream,
     get_catalog_item,
     create_catalog_item,
     update_catalog_item,
@@ -82,6 +87,17 @@ def config():
         timeout=30
     )
 
+@pytest.fixture(autouse=True)
+def clear_catalog_cache():
+    """Keep cached catalog reads and shared clients from leaking between tests."""
+    catalogue_builder._catalog_cache.clear()
+    catalogue_builder._clients.clear()
+    catalogue_builder._auth_header_cache.clear()
+    yield
+    catalogue_builder._catalog_cache.clear()
+    catalogue_builder._clients.clear()
+    catalogue_builder._auth_header_cache.clear()
+
 @pytest.fixture
 def auth_manager():
     """Create a mock authentication manager."""
@@ -193,6 +209,39 @@ async def test_list_catalog_items_with_filters(config, auth_manager, mock_client
         assert "active=true" in query_params["sysparm_query"]
         assert "test query" in query_params["sysparm_query"]
 
+@pytest.mark.asyncio
+async def test_list_catalog_items_stream_pages_until_short_page(config, auth_manager, mock_client):
+    """Streaming yields one list_catalog_items result per page and stops on a short page."""
+    mock_client.get.side_effect = [
+        create_mock_response(data={"result": [MOCK_CATALOG_ITEM] * 100}),
+        create_mock_response(data={"result": [MOCK_CATALOG_ITEM] * 3}),
+    ]
+    params = ListCatalogItemsParams(limit=500, offset=0)
+
+    with patch("httpx.AsyncClient", return_value=mock_client):
+        pages = [page async for page in list_catalog_items_stream(config, auth_manager, params)]
+
+    assert [page["count"] for page in pages] == [100, 3]
+    assert mock_client.get.call_args_list[1].kwargs["params"]["sysparm_offset"] == 100
+
+@pytest.mark.asyncio
+async def test_catalog_calls_share_one_client(config, auth_manager, mock_client):
+    """Every catalog call reuses the instance's pooled client until aclose_clients."""
+    mock_client.get.side_effect = [
+        create_mock_response(data={"result": []}),
+        create_mock_response(data={"result": []}),
+    ]
+
+    with patch("httpx.AsyncClient", return_value=mock_client) as client_cls:
+        await list_catalog_items(config, auth_manager, ListCatalogItemsParams(limit=10))
+        await list_catalog_categories(config, auth_manager, ListCatalogCategoriesParams(limit=10))
+        assert client_cls.call_count == 1
+
+        await catalogue_builder.aclose_clients()
+
+    mock_client.aclose.assert_awaited_once()
+    assert not catalogue_builder._clients
+
 # Get Catalog Item Tests
 @pytest.mark.asyncio
 async def test_get_catalog_item_success(config, auth_manager, mock_client):
@@ -237,6 +286,73 @@ async def test_get_catalog_item_not_found(config, auth_manager, mock_client):
         assert response.success is False
         assert "not found" in response.message.lower()
 
+@pytest.mark.asyncio
+async def test_get_catalog_item_coalesces_concurrent_lookups(config, auth_manager, mock_client):
+    """Concurrent lookups of the same item share one set of ServiceNow calls."""
+    mock_item_response = create_mock_response(data={"result": dict(MOCK_CATALOG_ITEM)})
+    mock_vars_response = create_mock_response(data={"result": []})
+    mock_client.get.side_effect = [mock_item_response, mock_vars_response]
+
+    params = GetCatalogItemParams(item_id="test_item_001")
+    with patch("httpx.AsyncClient", return_value=mock_client):
+        first, second = await asyncio.gather(
+            get_catalog_item(config, auth_manager, params),
+            get_catalog_item(config, auth_manager, params),
+        )
+
+    assert first.success is True
+    assert second == first
+    # Each caller gets its own copy to mutate
+    assert second.data is not first.data
+    assert mock_client.get.call_count == 2
+
+@pytest.mark.asyncio
+async def test_list_catalog_items_reuses_cached_result(config, auth_manager, mock_client):
+    """Identical listings are served from cache until a write invalidates it."""
+    mock_client.get.side_effect = [
+        create_mock_response(data={"result": [MOCK_CATALOG_ITEM]}),
+        create_mock_response(data={"result": []}),
+    ]
+    mock_client.post.return_value = create_mock_response(data={"result": MOCK_CATALOG_ITEM})
+    params = ListCatalogItemsParams(limit=10, offset=0)
+
+    with patch("httpx.AsyncClient", return_value=mock_client):
+        first = await list_catalog_items(config, auth_manager, params)
+        second = await list_catalog_items(config, auth_manager, params)
+        assert mock_client.get.call_count == 1
+        assert second["items"] == first["items"]
+        # A hit made no ServiceNow request, so it carries no upstream request id
+        assert second["request_id"] == ""
+
+        # Mutating a returned result does not change what the cache serves
+        second["items"].clear()
+        again = await list_catalog_items(config, auth_manager, params)
+        assert again["items"] == first["items"]
+        assert mock_client.get.call_count == 1
+
+        await create_catalog_item(config, auth_manager, CreateCatalogItemParams(
+            name="Test Item", description="Test Description", category="test_category",
+        ))
+        third = await list_catalog_items(config, auth_manager, params)
+
+    assert mock_client.get.call_count == 2
+    assert third["count"] == 0
+
+@pytest.mark.asyncio
+async def test_list_catalog_items_honors_no_store(config, auth_manager, mock_client):
+    """Responses marked no-store are never cached."""
+    mock_client.get.side_effect = [
+        create_mock_response(data={"result": [MOCK_CATALOG_ITEM]}, headers={"Cache-Control": "no-store"}),
+        create_mock_response(data={"result": [MOCK_CATALOG_ITEM]}, headers={"Cache-Control": "no-store"}),
+    ]
+    params = ListCatalogItemsParams(limit=10, offset=0)
+
+    with patch("httpx.AsyncClient", return_value=mock_client):
+        await list_catalog_items(config, auth_manager, params)
+        await list_catalog_items(config, auth_manager, params)
+
+    assert mock_client.get.call_count == 2
+
 # Create Catalog Item Tests
 @pytest.mark.asyncio
 async def test_create_catalog_item_success(config, auth_manager, mock_client):
@@ -467,3 +583,97 @@ async def test_permission_error_handling(config, auth_manager, mock_client):
         assert response.success is False
         assert "Not authorized" in response.message
 
+
+
+@pytest.mark.asyncio
+async def test_auth_headers_cached_per_manager():
+    """Auth headers are fetched once per manager and handed out as copies."""
+    calls = []
+
+    class _Auth:
+        async def aget_headers(self):
+            calls.append(1)
+            return {"Authorization": "Bearer cached"}
+
+    class _Client:
+        def __init__(self, auth_manager):
+            self.auth_manager = auth_manager
+
+    auth = _Auth()
+    first = await catalogue_builder._get_auth_headers(auth)
+    first["Accept"] = "application/json"
+    second = await catalogue_builder._get_auth_headers(_Client(auth))
+    assert second == {"Authorization": "Bearer cached"}
+    assert len(calls) == 1
+
+
+@pytest.mark.asyncio
+async def test_list_catalog_items_decodes_real_response(config, auth_manager, mock_client):
+    """Real httpx responses are decoded from their raw body."""
+    request = httpx.Request("GET", f"{config.instance_url}/api/now/v1/servicecatalog/items")
+    mock_client.get.return_value = httpx.Response(
+        200,
+        content=b'{"result": [{"sys_id": "abc", "name": "Laptop", "active": true}]}',
+        headers={"X-Total-Count": "1"},
+        request=request,
+    )
+
+    with patch("httpx.AsyncClient", return_value=mock_client):
+        result = await list_catalog_items(config, auth_manager, ListCatalogItemsParams(limit=10))
+
+    assert result["items"][0]["name"] == "Laptop"
+    assert result["items"][0]["active"] is True
+    assert result["total"] == 1
+
+
+@pytest.mark.asyncio
+async def test_get_catalog_item_requests_variables_concurrently(config, auth_manager, mock_client):
+    """The item and variables requests are both in flight before either returns."""
+    started = []
+    both_started = asyncio.Event()
+
+    async def get(url, **kwargs):
+        started.append(url)
+        if len(started) == 2:
+            both_started.set()
+        await both_started.wait()
+        if url.endswith("/variables"):
+            return await create_mock_response(data={"result": [{"name": "test_var"}]})
+        return await create_mock_response(data={"result": dict(MOCK_CATALOG_ITEM)})
+
+    mock_client.get.side_effect = get
+    variables = [{"name": "test_var"}]
+
+    with patch("httpx.AsyncClient", return_value=mock_client):
+        response = await asyncio.wait_for(
+            get_catalog_item(config, auth_manager, GetCatalogItemParams(item_id="test_item_001")),
+            timeout=5,
+        )
+
+    assert response.success is True
+    assert response.data["item"]["variables"] == variables
+    assert len(started) == 2
+
+
+@pytest.mark.asyncio
+async def test_auth_headers_dropped_on_401_and_with_manager(config, mock_client):
+    """A 401 forgets the cached headers, and the cache does not keep managers alive."""
+    class _Auth:
+        async def aget_headers(self):
+            return {"Authorization": "Bearer revoked"}
+
+    auth = _Auth()
+    mock_client.get.return_value = create_mock_response(status_code=401)
+
+    with patch("httpx.AsyncClient", return_value=mock_client):
+        with pytest.raises(ValueError):
+            await list_catalog_items(config, auth, ListCatalogItemsParams(limit=10))
+    assert auth not in catalogue_builder._auth_header_cache
+
+    await catalogue_builder._get_auth_headers(auth)
+    assert auth in catalogue_builder._auth_header_cache
+    ref = weakref.ref(auth)
+    del auth
+    gc.collect()
+    assert ref() is None
+    assert len(catalogue_builder._auth_header_cache) == 0
@@ -1,6 +1,7 @@
 """Minimal end-to-end tests for /rpc and /events."""
 from fastapi.testclient import TestClient
 
+from config import reload_runtime_settings
 from main import app
 
 
@@ -9,6 +10,7 @@ def test_e2e_rpc_and_metrics(monkeypatch):
     monkeypatch.setenv("RPC_AUTH_TOKEN", "secret")
     monkeypatch.setenv("RPC_ALLOW_PARAMS_AUTH", "false")
     monkeypatch.setenv("EVENTS_AUTH_REQUIRED", "true")
+    reload_runtime_settings()
 
     client = TestClient(app, base_url="http://testserver")
 
@@ -53,3 +55,116 @@ def test_e2e_rpc_and_metrics(monkeypatch):
     )
     assert r.status_code == 200
     assert "event: tick" in r.text
+
+
+def test_health_reuses_recent_check(monkeypatch):
+    from src import main as app_main
+
+    calls = []
+
+    async def fake_validate():
+        calls.append(1)
+        return True
+
+    monkeypatch.setattr(app_main, "_health_cache", app_main._AsyncTTLCache(60))
+    monkeypatch.setattr(app_main._get_mcp_server(), "validate_connection", fake_validate)
+    client = TestClient(app, base_url="http://testserver")
+    assert client.get("/health").json() == {"status": True}
+    assert client.get("/health").json() == {"status": True}
+    assert len(calls) == 1
+
+
+def test_health_details_sample_is_opt_in(monkeypatch):
+    from src import main as app_main
+
+    class FakeResponse:
+        status_code = 200
+        content = b'{"result": [{"sys_id": "u1"}]}'
+
+    async def fake_get(url, params=None):
+        return FakeResponse()
+
+    server = app_main._get_mcp_server()
+    monkeypatch.setattr(server.http_client, "get", fake_get)
+    monkeypatch.setattr(app_main, "_health_details_cache", app_main._AsyncTTLCache(0))
+    monkeypatch.setattr(app_main, "_health_sample_cache", app_main._AsyncTTLCache(0))
+    client = TestClient(app, base_url="http://testserver")
+
+    details = client.get("/health/details").json()
+    assert details["status"] is True
+    assert "sample" not in details
+
+    details = client.get("/health/details", params={"sample": "true"}).json()
+    assert details["sample"] == {"result": [{"sys_id": "u1"}]}
+
+
+def test_routes_are_registered_once():
+    # A repeated (path, method) pair is shadowed by the first match and only
+    # lengthens Starlette's linear route scan
+    seen = set()
+    for route in app.routes:
+        for method in getattr(route, "methods", None) or ():
+            key = (route.path, method)
+            assert key not in seen, key
+            seen.add(key)
+
+
+def test_large_responses_are_gzipped_but_sse_is_not():
+    client = TestClient(app, base_url="http://testserver")
+
+    r = client.get("/tools", headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200
+    assert r.headers.get("content-encoding") == "gzip"
+
+    r = client.get("/events", params={"interval": 0, "limit": 1}, headers={"Accept-Encoding": "gzip"})
+    assert r.status_code == 200
+    assert "content-encoding" not in r.headers
+
+
+def test_tools_revalidates_with_etag():
+    client = TestClient(app, base_url="http://testserver")
+
+    r = client.get("/tools")
+    assert r.status_code == 200
+    assert r.headers["cache-control"] == "public, max-age=30"
+    etag = r.headers["etag"]
+
+    r = client.get("/tools", headers={"If-None-Match": etag})
+    assert r.status_code == 304
+    assert r.content == b""
+
+
+def test_tools_body_built_once(monkeypatch):
+    from src import main as app_main
+
+    server = app_main._get_mcp_server()
+    calls = []
+    real_list_tools = server.list_tools
+
+    async def counting_list_tools():
+        calls.append(1)
+        return await real_list_tools()
+
+    monkeypatch.setattr(app_main, "_tools_body", None)
+    monkeypatch.setattr(server, "list_tools", counting_list_tools)
+    client = TestClient(app, base_url="http://testserver")
+
+    first = client.get("/tools")
+    second = client.get("/tools")
+    assert first.content == second.content
+    assert first.headers["etag"] == second.headers["etag"]
+    assert len(calls) == 1
+
+
+def test_lifespan_builds_one_server_before_serving():
+    from src import main as app_main
+
+    app_main._get_mcp_server.cache_clear()
+    try:
+        with TestClient(app_main.app):
+            # Warm-up has finished (not merely been scheduled) once startup completes
+            assert app_main._get_mcp_server.cache_info().currsize == 1
+            server = app_main._get_mcp_server()
+        assert app_main._get_mcp_server() is server
+    finally:
+        app_main._get_mcp_server.cache_clear()
@@ -0,0 +1,33 @@
+"""
+Tests for the queued logging setup.
+"""
+import logging
+import os
+
+import pytest
+
+from utils import logging as log_setup
+
+
+@pytest.mark.skipif(not hasattr(os, "fork"), reason="requires fork")
+def test_forked_child_logs_through_its_own_listener(tmp_path):
+    """Records logged in a forked worker still reach the handlers"""
+    root = logging.getLogger()
+    level = logging.getLevelName(root.level)
+    log_file = tmp_path / "app.log"
+    log_setup.setup_logging(log_level="INFO", log_file=str(log_file))
+    try:
+        pid = os.fork()
+        if pid == 0:
+            logging.getLogger("forked").warning("from child")
+            log_setup._stop_listener()
+            os._exit(0)
+        _, status = os.waitpid(pid, 0)
+        assert os.WIFEXITED(status) and os.WEXITSTATUS(status) == 0
+        logging.getLogger("forked").warning("from parent")
+        log_setup._stop_listener()
+        contents = log_file.read_text()
+        assert "from child" in contents
+        assert "from parent" in contents
+    finally:
+        log_setup.setup_logging(log_level=level)
@@ -57,4 +57,11 @@ def test_mcp_response_validation():
             version="0.1",
             type="invalid",
             id="test-3"
-        )
\ No newline at end of file
+        )
+
+def test_mcp_request_construct_internal():
+    """Test the internal constructor fills protocol constants"""
+    request = MCPRequest.construct_internal(id="7", tool="service_desk.list_incidents", parameters={"limit": 1})
+    assert request.version == "1.0"
+    assert request.type == "request"
+    assert request.parameters == {"limit": 1}
@@ -1,6 +1,7 @@
 """Tests for the JSON-RPC endpoint (/rpc)."""
 from fastapi.testclient import TestClient
 
+from config import reload_runtime_settings
 from main import app
 
 
@@ -53,6 +54,7 @@ def test_rpc_tools_call_smoke():
 def test_rpc_tools_call_auth(monkeypatch):
     # Enforce token and verify Unauthorized then success with token
     monkeypatch.setenv("RPC_AUTH_TOKEN", "secret")
+    reload_runtime_settings()
 
     # Missing token -> Unauthorized
     payload = {
@@ -85,6 +87,7 @@ def test_rpc_tools_call_auth(monkeypatch):
 def test_rpc_tools_call_auth_header(monkeypatch):
     # Enforce token and verify success using Authorization header
     monkeypatch.setenv("RPC_AUTH_TOKEN", "secret")
+    reload_runtime_settings()
     payload = {
         "jsonrpc": "2.0",
         "id": 6,
@@ -100,3 +103,55 @@ def test_rpc_tools_call_auth_header(monkeypatch):
     assert data.get("jsonrpc") == "2.0"
     assert data.get("id") == 6
     assert ("result" in data) or ("error" in data)
+
+
+def test_rpc_invalid_request_envelope():
+    # Malformed requests get a JSON-RPC error, not an HTTP validation error
+    r = client.post("/rpc", json={"id": 7, "method": "initialize"})
+    assert r.status_code == 200
+    data = r.json()
+    assert data.get("id") == 7
+    assert data["error"]["code"] == -32600
+
+
+def test_rpc_preflight_is_cacheable():
+    r = client.options(
+        "/rpc",
+        headers={"Origin": "http://example.com", "Access-Control-Request-Method": "POST"},
+    )
+    assert r.status_code == 200
+    assert int(r.headers["access-control-max-age"]) > 0
+
+
+def test_request_id_header():
+    r = client.get("/health", headers={"X-Request-ID": "abc123"})
+    assert r.headers["x-request-id"] == "abc123"
+    r = client.get("/health")
+    assert r.headers["x-request-id"]
+
+
+def test_rpc_parse_error():
+    r = client.post("/rpc", content=b"{not json", headers={"Content-Type": "application/json"})
+    assert r.status_code == 200
+    assert r.json()["error"]["code"] == -32700
+
+
+def test_rpc_stream_tools_call():
+    payload = {
+        "jsonrpc": "2.0",
+        "id": 8,
+        "method": "tools/call",
+        "params": {"name": "service_desk.list_incidents", "arguments": {"limit": 1}},
+    }
+    r = client.post("/rpc/stream", json=payload)
+    assert r.status_code == 200
+    assert "text/event-stream" in r.headers.get("content-type", "")
+    # Either partial results followed by done, or a single error frame
+    assert "event: done" in r.text or "event: error" in r.text
+
+
+def test_rpc_stream_rejects_other_methods():
+    r = client.post("/rpc/stream", json={"jsonrpc": "2.0", "id": 9, "method": "initialize"})
+    assert r.status_code == 200
+    assert "event: error" in r.text
+    assert "-32601" in r.text
@@ -0,0 +1,69 @@
+"""
+Tests for ServiceNowMCPServer tool dispatch.
+"""
+import pytest
+
+from config import ServerConfig, AuthConfig, AuthType, BasicAuthConfig
+from mcp_core.protocol import MCPRequest
+from mcp_core.server import ServiceNowMCPServer, _param_spec
+
+
+@pytest.fixture
+def server() -> ServiceNowMCPServer:
+    config = ServerConfig(
+        instance_url="https://test.service-now.com",
+        auth=AuthConfig(type=AuthType.BASIC, basic=BasicAuthConfig(username="u", password="p")),
+    )
+    return ServiceNowMCPServer(config)
+
+
+def test_operations_declare_params_binding(server):
+    """Every operation declares its params model so nothing is introspected per request"""
+    for module_name, module in server.tools.items():
+        for operation, op_meta in module.OPERATIONS.items():
+            tool_name = f"{module_name}.{operation}"
+            assert "params_model" in op_meta, tool_name
+            assert "params_arg_name" in op_meta, tool_name
+            # The declaration must agree with the function signature
+            spec = _param_spec(getattr(module, operation))
+            assert spec.name == op_meta["params_arg_name"], tool_name
+            assert spec.model is op_meta["params_model"], tool_name
+
+
+def test_tool_metadata_excludes_binding_keys(server):
+    """/tools serves tool_metadata as JSON, so model classes must not leak into it"""
+    for tool_name, meta in server.tool_metadata.items():
+        assert "params_model" not in meta, tool_name
+        assert "params_arg_name" not in meta, tool_name
+
+
+@pytest.mark.asyncio
+async def test_missing_required_params_reported_together(server):
+    """All missing required parameters are listed in one error"""
+    request = MCPRequest.construct_internal(id="1", tool="service_desk.add_comment", parameters={})
+    response = await server.handle_request(request)
+
+    assert response.type == "error"
+    assert response.error == "Missing required parameters: comment, incident_number"
+
+
+@pytest.mark.asyncio
+async def test_unknown_tool_error_serializes_with_defaults(server):
+    """Error responses skip validation but still carry every field"""
+    request = MCPRequest.construct_internal(id="1", tool="nope", parameters={})
+    response = await server.handle_request(request)
+
+    assert response.error == "Invalid tool name format. Expected: module.operation"
+    assert response.result is None
+    assert '"result":null' in response.model_dump_json()
+
+
+@pytest.mark.asyncio
+async def test_aclose_closes_shared_http_client(server):
+    """The server's ServiceNow client is pooled and released by aclose"""
+    shared = await server.http_client._client()
+    assert await server.http_client._client() is shared
+
+    await server.aclose()
+
+    assert shared.is_closed
@@ -13,6 +13,7 @@ from test_utils import (
 
 from tools.service_desk import (
     list_incidents,
+    list_incidents_stream,
     list_my_incidents,
     get_incident,
     create_incident,
@@ -46,6 +47,18 @@ async def test_list_incidents():
     assert len(result["incidents"]) > 0
     assert result["incidents"][0]["number"] == MOCK_INCIDENT_DATA["number"]
 
+@pytest.mark.asyncio
+async def test_list_incidents_stream_stops_on_short_page():
+    """Test streaming incidents ends once a page comes back short"""
+    params = ListIncidentsParams(limit=5, offset=0)
+
+    mock_client = make_mock_snow_client({"incidents": [MOCK_INCIDENT_DATA]})
+
+    pages = [page async for page in list_incidents_stream(mock_server_config, mock_client, params)]
+
+    assert len(pages) == 1
+    assert pages[0]["incidents"][0]["number"] == MOCK_INCIDENT_DATA["number"]
+
 @pytest.mark.asyncio
 async def test_get_incident():
     """Test getting a specific incident"""
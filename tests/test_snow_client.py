@@ -0,0 +1,75 @@
+"""
+Tests for the ServiceNow HTTP client used by the MCP server.
+"""
+import gzip
+
+import httpx
+import pytest
+
+from config import ServerConfig, AuthConfig, AuthType, BasicAuthConfig
+from utils import snow_client
+from utils.snow_client import ServiceNowClient
+
+
+class _StaticAuth:
+    async def aget_headers(self):
+        return {"Authorization": "Basic dTpw"}
+
+
+@pytest.fixture
+def config() -> ServerConfig:
+    return ServerConfig(
+        instance_url="https://test.service-now.com",
+        auth=AuthConfig(type=AuthType.BASIC, basic=BasicAuthConfig(username="u", password="p")),
+    )
+
+
+@pytest.mark.asyncio
+async def test_get_revalidates_with_etag(config, monkeypatch):
+    """A repeated GET sends the stored validators and a 304 returns the stored body"""
+    seen = []
+
+    def handler(request):
+        seen.append(request.headers.get("If-None-Match"))
+        if request.headers.get("If-None-Match") == '"v1"':
+            return httpx.Response(304, headers={"ETag": '"v1"'})
+        body = gzip.compress(b'{"result": {"number": "INC0001"}}')
+        return httpx.Response(200, headers={"ETag": '"v1"', "Content-Encoding": "gzip"}, content=body)
+
+    monkeypatch.setattr(
+        snow_client, "get_secure_client",
+        lambda timeout: httpx.AsyncClient(transport=httpx.MockTransport(handler)),
+    )
+    client = ServiceNowClient(config, _StaticAuth())
+    url = f"{config.instance_url}/api/now/table/incident/abc"
+
+    first = await client.get(url, params={"sysparm_limit": 1})
+    second = await client.get(url, params={"sysparm_limit": 1})
+    await client.aclose()
+
+    assert seen == [None, '"v1"']
+    assert second.status_code == 200
+    assert second.json() == first.json() == {"result": {"number": "INC0001"}}
+
+
+@pytest.mark.asyncio
+async def test_requests_share_one_pooled_client(config, monkeypatch):
+    """Every request goes through the same AsyncClient until aclose"""
+    created = []
+
+    def factory(timeout):
+        client = httpx.AsyncClient(transport=httpx.MockTransport(lambda request: httpx.Response(200, json={"result": {}})))
+        created.append(client)
+        return client
+
+    monkeypatch.setattr(snow_client, "get_secure_client", factory)
+    client = ServiceNowClient(config, _StaticAuth())
+    url = f"{config.instance_url}/api/now/table/incident"
+
+    await client.get(url)
+    await client.post(url, json={"short_description": "x"})
+    await client.get(url)
+    assert len(created) == 1
+
+    await client.aclose()
+    assert created[0].is_closed
@@ -1,6 +1,7 @@
 """Tests for the SSE streaming endpoint (/events)."""
 from fastapi.testclient import TestClient
 
+from config import reload_runtime_settings
 from main import app
 
 
@@ -40,6 +41,7 @@ def test_sse_events_auth(monkeypatch):
     # Require auth and ensure 401 without token, 200 with
     monkeypatch.setenv("EVENTS_AUTH_REQUIRED", "true")
     monkeypatch.setenv("EVENTS_AUTH_TOKEN", "secret")
+    reload_runtime_settings()
 
     client = TestClient(app, base_url="http://testserver")
 
@@ -55,3 +57,12 @@ def test_sse_events_auth(monkeypatch):
     )
     assert r.status_code == 200
     assert "event: tick" in r.text
+
+
+def test_sse_events_heartbeat_between_ticks():
+    client = TestClient(app, base_url="http://testserver")
+    r = client.get("/events", params={"interval": 0.01, "limit": 2, "heartbeat": 3})
+    assert r.status_code == 200
+    # tick, ping, ping, tick
+    assert r.text.count("event: tick") == 2
+    assert r.text.count(": ping") == 2